@@ -641,14 +641,13 @@ class CameraSource:
         print(f"[Camera {self.camera_id}] Capture loop stopped")
 
     def _read_realsense(self) -> Tuple[bool, Optional[np.ndarray], Optional[np.ndarray]]:
-        """Return the latest captured frame."""
-        with self._lock:
-            if self._latest_frame is not None:
-                # Check if frame is stale (older than 2 seconds)
-                if time.time() - self._last_frame_time > 2.0:
-                    return False, None, None
-                return True, self._latest_frame.copy(), (self._latest_depth.copy() if self._latest_depth is not None else None)
-            return False, None, None
+        """Return the latest captured frame. Caller must hold self._lock."""
+        if self._latest_frame is not None:
+            # Check if frame is stale (older than 2 seconds)
+            if time.time() - self._last_frame_time > 2.0:
+                return False, None, None
+            return True, self._latest_frame.copy(), (self._latest_depth.copy() if self._latest_depth is not None else None)
+        return False, None, None
 
 
     # -------------------------------------------------------------------------
@@ -665,11 +664,38 @@ class CameraSource:
             - frame: BGR color frame (numpy array) or None
             - depth_frame: Depth frame (numpy array) or None
         """
+        # Single lock acquisition — _read_realsense runs under it
         with self._lock:
             if self.pipeline:
                 return self._read_realsense()
             return False, None, None
 
+    def read_color(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Read only the latest color frame (no depth copy).
+
+        Used by the MJPEG preview, which never looks at depth — saves a
+        ~800 KB depth copy per preview frame.
+
+        Args:
+            out: Optional buffer from a previous call. If its shape and dtype
+                 match, the frame is copied into it instead of allocating.
+
+        Returns:
+            Tuple of (success, frame) — frame is ``out`` when it was reused
+        """
+        with self._lock:
+            if self.pipeline and self._latest_frame is not None:
+                # Check if frame is stale (older than 2 seconds)
+                if time.time() - self._last_frame_time > 2.0:
+                    return False, None
+                latest = self._latest_frame
+                if out is not None and out.shape == latest.shape and out.dtype == latest.dtype:
+                    np.copyto(out, latest)
+                    return True, out
+                return True, latest.copy()
+            return False, None
+
     def get_pipeline(self):
         """Get the RealSense pipeline."""
         return self.pipeline if self.camera_type == CAMERA_TYPE_REALSENSE else None
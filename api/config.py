@@ -23,6 +23,7 @@ Recording Behavior:
     - Viewing/Tagging uses .mp4 files; Processing prefers .bag for depth data
 """
 
+import json
 import os
 import time
 from pathlib import Path
@@ -44,6 +45,12 @@ state_lock = threading.Lock()
 REMOTE_MODE = os.environ.get("REMOTE_MODE", "false").lower() == "true"
 API_HOST = os.environ.get("API_HOST", "0.0.0.0" if REMOTE_MODE else "localhost")
 
+# When served behind nginx, set to the internal location that aliases
+# RECORDINGS_DIR (e.g. "/internal/recordings/"). Video/BAG downloads then
+# return an X-Accel-Redirect header and nginx streams the file itself.
+# Empty (default) = the API sends the file.
+ACCEL_REDIRECT_PREFIX = os.environ.get("ACCEL_REDIRECT_PREFIX", "")
+
 # =============================================================================
 #                              CAMERA CONFIGURATION
 # =============================================================================
@@ -106,6 +113,75 @@ except ImportError:
     FFMPEG_AVAILABLE = False
     print("[Config] imageio-ffmpeg not available")
 
+# orjson - fast JSON serialisation for API responses (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    print("[Config] orjson loaded successfully")
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+    print("[Config] orjson not available")
+
+# PyTurboJPEG - libjpeg-turbo SIMD encoder for the MJPEG preview
+# (needs the libturbojpeg shared library; falls back to cv2.imencode)
+try:
+    from turbojpeg import TurboJPEG
+    turbo_jpeg = TurboJPEG()
+    TURBOJPEG_AVAILABLE = True
+    print("[Config] PyTurboJPEG loaded successfully")
+except (ImportError, OSError, RuntimeError):
+    turbo_jpeg = None
+    TURBOJPEG_AVAILABLE = False
+    print("[Config] PyTurboJPEG not available")
+
+# FFmpeg / FFprobe binaries - resolved once here instead of per request
+FFMPEG_PATH = None
+FFPROBE_PATH = None
+if FFMPEG_AVAILABLE:
+    try:
+        FFMPEG_PATH = imageio_ffmpeg.get_ffmpeg_exe()
+        _ffprobe = os.path.join(
+            os.path.dirname(FFMPEG_PATH), 'ffprobe.exe' if os.name == 'nt' else 'ffprobe'
+        )
+        FFPROBE_PATH = _ffprobe if os.path.exists(_ffprobe) else None
+    except Exception as e:
+        print(f"[Config] imageio-ffmpeg binary not found: {e}")
+
+
+# =============================================================================
+#                              JSON FILE HELPERS
+# =============================================================================
+
+def read_json_file(path):
+    """Parse a JSON file (orjson parses the raw bytes, no separate UTF-8 decode)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    return json.loads(Path(path).read_text())
+
+
+def write_json_file(path, data) -> None:
+    """
+    Write data as 2-space indented JSON (sidecars stay human-readable).
+
+    Written to a temp file next to the target and swapped in with os.replace,
+    so concurrent readers (listing polls) see either the old file or the new
+    one, never a truncated one.
+    """
+    path = Path(path)
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    # Unique per writer so two threads saving the same sidecar don't share a temp file
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
 
 # =============================================================================
 #                         REALSENSE DEVICE DETECTION
@@ -16,12 +16,13 @@ Both cameras of a batch are converted in PARALLEL; batches are sequential
 is_batch_converting() can be used to guard against that).
 """
 
-import json
 import os
+import shutil
 import threading
 import time
 import uuid
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
@@ -29,13 +30,14 @@ import numpy as np
 
 from config import (
     RECORDINGS_DIR,
-    FFMPEG_AVAILABLE,
-    imageio_ffmpeg,
+    FFMPEG_PATH,
     REALSENSE_AVAILABLE,
     rs,
     DEFAULT_FPS,
     CAMERA_TYPE_REALSENSE,
     CAMERA_MODE,
+    read_json_file,
+    write_json_file,
 )
 
 
@@ -105,7 +107,7 @@ def get_all_conversion_jobs() -> list:
     """Return all jobs (newest first by created_at)."""
     with conversion_lock:
         jobs = list(conversion_jobs.values())
-    return sorted(jobs, key=lambda j: j.get("created_at", ""), reverse=True)
+    return sorted(jobs, key=itemgetter("created_at"), reverse=True)
 
 
 def is_batch_converting(batch_id: str) -> Tuple[bool, Optional[str]]:
@@ -123,16 +125,11 @@ def is_batch_converting(batch_id: str) -> Tuple[bool, Optional[str]]:
 
 def _get_ffmpeg_path() -> Optional[str]:
     """Return path to FFmpeg binary prioritizing the system ffmpeg."""
-    import shutil
-    sys_ffmpeg = shutil.which("ffmpeg")
-    if sys_ffmpeg:
-        return sys_ffmpeg
-    if not FFMPEG_AVAILABLE or imageio_ffmpeg is None:
-        return None
-    try:
-        return imageio_ffmpeg.get_ffmpeg_exe()
-    except Exception:
-        return None
+    return shutil.which("ffmpeg") or FFMPEG_PATH
+
+
+# Resolved once at import — PATH and the bundled binary don't change at runtime
+CONVERSION_FFMPEG_PATH = _get_ffmpeg_path()
 
 
 def _count_bag_frames(bag_path: Path) -> dict:
@@ -200,7 +197,7 @@ def _update_metadata_sidecar(
     meta: dict = {}
     if meta_path.exists():
         try:
-            meta = json.loads(meta_path.read_text())
+            meta = read_json_file(meta_path)
         except Exception:
             pass
 
@@ -222,7 +219,7 @@ def _update_metadata_sidecar(
     if extra_data:
         meta.update(extra_data)
 
-    meta_path.write_text(json.dumps(meta, indent=2))
+    write_json_file(meta_path, meta)
     print(f"[Conversion] Metadata updated: {meta_path.name}")
 
 
@@ -294,7 +291,7 @@ def _convert_single_camera(job_id: str, cam_num: int, batch_id: str):
         _update_metadata_sidecar(meta_path, mp4_path.name, 0)
         return
 
-    ffmpeg_path = _get_ffmpeg_path()
+    ffmpeg_path = CONVERSION_FFMPEG_PATH
     if not ffmpeg_path:
         _update({"status": "failed", "error": "FFmpeg not available"})
         return
@@ -308,7 +305,7 @@ def _convert_single_camera(job_id: str, cam_num: int, batch_id: str):
 
     if meta_path.exists():
         try:
-            meta = json.loads(meta_path.read_text())
+            meta = read_json_file(meta_path)
             fps = float(meta.get("fps", DEFAULT_FPS))
             camera_view = meta.get("camera_view", camera_view)
             patient_id = meta.get("patient_id", "")
@@ -401,7 +398,6 @@ def _convert_single_camera(job_id: str, cam_num: int, batch_id: str):
             print(f"[Conversion] {cam_key}: BAG stream {actual_w}x{actual_h} @ {actual_fps}fps")
 
             if encoder_name == "nvv4l2h264enc":
-                import shutil
                 if not shutil.which("gst-launch-1.0"):
                     raise Exception("gst-launch-1.0 not found in PATH")
                 
@@ -11,6 +11,7 @@ Modules:
     writers.py     - Video writers (BAG, MP4, FFmpeg)
     processing.py  - Video processing and analysis pipeline
     conversion.py  - Post-recording BAG→MP4 conversion pipeline
+    mp4info.py     - MP4 atom reader (frame count / fps from moov)
 
 Camera Modes (set via CAMERA_MODE env var):
     auto           - Auto-detect RealSense cameras (DEFAULT)
@@ -29,35 +30,50 @@ Camera Priority:
     If only one camera is connected, only camera1 files are recorded.
 """
 
-from fastapi import FastAPI, Request, BackgroundTasks
-from fastapi.responses import StreamingResponse, FileResponse, JSONResponse
+from fastapi import FastAPI, Request, BackgroundTasks, Depends
+from fastapi.responses import StreamingResponse, FileResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import cv2
+import csv
 import numpy as np
 import threading
 import time
 import json
 import subprocess
 import os
+import asyncio
 import re
+import stat
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache, partial
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
 
 # Local modules
 from config import (
     CAMERA_MODE,
+    ACCEL_REDIRECT_PREFIX,
     RECORDINGS_DIR,
     TAGGING_DIR,
     PROCESSED_DIR,
     FFMPEG_AVAILABLE,
+    FFMPEG_PATH,
+    FFPROBE_PATH,
+    ORJSON_AVAILABLE,
+    orjson,
+    TURBOJPEG_AVAILABLE,
+    turbo_jpeg,
     REALSENSE_AVAILABLE,
     rs,
-    imageio_ffmpeg,
     JPEG_QUALITY,
     DEFAULT_FPS,
     CAMERA_TYPE_REALSENSE,
     get_detected_cameras,
     refresh_camera_detection,
+    write_json_file,
     SYSTEM_STATE,
     state_lock
 )
@@ -84,6 +100,8 @@ from processing import (
     get_all_jobs,
     is_batch_processing
 )
+from mp4info import read_mp4_video_info
+from writers import detect_hw_encoder, H264_ENCODER_ARGS
 from conversion import (
     convert_bag_to_mp4,
     create_conversion_job,
@@ -98,10 +116,15 @@ from conversion import (
 #                              FASTAPI APP SETUP
 # =============================================================================
 
+# orjson (when installed) for both directions: responses and file parsing.
+# orjson.loads takes bytes directly, so files are read with read_bytes().
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 app = FastAPI(
     title="Parkinson Camera API",
     description="Clinical motion analysis for Parkinson's disease",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
 )
 
 app.add_middleware(
@@ -112,9 +135,28 @@ app.add_middleware(
 )
 
 
+# _run_blocking() work (listings, sidecar reads, ffprobe) gets its own
+# executor so a burst of slow disk calls can't queue behind, or starve,
+# Starlette's sync-route threadpool.
+API_IO_WORKERS = min(32, (os.cpu_count() or 4) + 4)
+
+
+def _run_blocking(fn, *args):
+    """
+    Run a blocking call on the default executor; returns an awaitable.
+
+    Stand-in for asyncio.to_thread(), which needs Python 3.9 — the Jetson
+    runs Python 3.8 (JetPack 5).
+    """
+    return asyncio.get_running_loop().run_in_executor(None, partial(fn, *args))
+
+
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     """Start all detected cameras on server boot."""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=API_IO_WORKERS, thread_name_prefix="api-io")
+    )
     startup_all_cameras()
 
 
@@ -130,22 +172,62 @@ def on_shutdown():
 
 WARMUP_DURATION = 3  # seconds for camera auto-exposure to stabilize before writing
 
-recording_state = {
-    "status": "idle",           # idle, warming_up, recording, paused
-    "start_time": None,         # Actual recording start (set after warm-up)
-    "warmup_start": None,       # When warm-up began (for countdown)
-    "timestamp_str": None,      # Timestamp string used for file naming
-    "writers_bag": {},          # logical_cam_id -> True/None (BAG recording via pipeline)
-    "filenames_bag": {},        # logical_cam_id -> filename
-    "camera_types": {},         # logical_cam_id -> camera_type
-    "fps_per_cam": {},          # logical_cam_id -> actual fps at recording start
-    "patient_name": "",
-    "patient_id": "",
-    # Sync tracking
-    "recording_start_times": {},    # logical_cam_id -> ISO timestamp
-    "inter_camera_offset_ms": 0.0,  # ms between camera starts
-    "pipeline_restart_ms": {},      # logical_cam_id -> ms for pipeline restart
-}
+# Set by stop_recording during warm-up so the warm-up thread wakes at once
+# instead of sleeping out the full WARMUP_DURATION
+_warmup_cancel = threading.Event()
+
+class RecordingState:
+    """
+    State of the current recording session. Guarded by recording_lock.
+
+    ``__slots__`` fixes the field set: plain attribute access instead of
+    string-keyed dict lookups, and a mistyped field name raises instead of
+    silently adding a key. Per-camera fields stay dicts keyed by logical
+    camera id (0/1) — an offline camera simply has no entry (orphan mode).
+    """
+
+    __slots__ = (
+        "status", "start_time", "warmup_start", "timestamp_str",
+        "writers_bag", "filenames_bag", "paths_bag", "camera_types", "fps_per_cam",
+        "patient_name", "patient_id",
+        "recording_start_times", "inter_camera_offset_ms", "pipeline_restart_ms",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Return to idle with no per-camera state.
+
+        Per-camera dicts are replaced, not cleared, so references taken
+        under the lock just before a reset remain a valid snapshot.
+        """
+        self.status = "idle"            # idle, warming_up, recording, paused
+        self.start_time = None          # Actual recording start (set after warm-up)
+        self.warmup_start = None        # When warm-up began (for countdown)
+        self.timestamp_str = None       # Timestamp string used for file naming
+        self.writers_bag = {}           # logical_cam_id -> True/None (BAG recording via pipeline)
+        self.filenames_bag = {}         # logical_cam_id -> filename
+        self.paths_bag = {}             # logical_cam_id -> full path (str), built once at prepare
+        self.camera_types = {}          # logical_cam_id -> camera_type
+        self.fps_per_cam = {}           # logical_cam_id -> actual fps at recording start
+        self.patient_name = ""
+        self.patient_id = ""
+        # Sync tracking
+        self.recording_start_times = {}     # logical_cam_id -> ISO timestamp
+        self.inter_camera_offset_ms = 0.0   # ms between camera starts
+        self.pipeline_restart_ms = {}       # logical_cam_id -> ms for pipeline restart
+
+
+recording_state = RecordingState()
+
+# Lock invariant: recording_lock guards recording_state fields and nothing
+# else. It is never held across camera calls (prepare/commit/stop/pause of a
+# pipeline), file I/O or sleeps: take what you need under the lock, release,
+# do the slow work, then re-acquire to publish results (re-checking status,
+# since a stop may have happened in between). /recording/status takes this
+# lock on the event loop, so a long hold would stall the whole API.
 recording_lock = threading.Lock()
 
 
@@ -180,20 +262,26 @@ STREAM_FPS_IDLE = 30       # Preview FPS when not recording (smooth enough)
 STREAM_FPS_RECORDING = 10  # Preview FPS during recording (save CPU/bandwidth for BAG)
 
 
-def gen_frames(camera_id: int):
-    """
-    Generate MJPEG frames from a camera.
+def _encode_jpeg(frame: np.ndarray, quality: int = JPEG_QUALITY) -> bytes:
+    """Encode a BGR frame to JPEG bytes (libjpeg-turbo when available, else OpenCV)."""
+    if TURBOJPEG_AVAILABLE:
+        return turbo_jpeg.encode(frame, quality=quality)
+    _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return buffer.tobytes()
 
-    This stream lives as long as the HTTP connection does — it NEVER
-    closes voluntarily.  If the camera is offline or restarting, the
-    generator yields a placeholder frame to keep the connection alive
-    and allow detection of client disconnects (via write errors).
+
+# Multipart framing around each JPEG in the MJPEG stream
+_MJPEG_PART_HEAD = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+_MJPEG_PART_TAIL = b'\r\n'
+
+
+def _render_placeholder_chunk() -> bytes:
     """
-    last_good_frame = None
+    Render the "WAITING FOR CAMERA..." multipart chunk.
 
-    # Pre-render a placeholder frame to yield when camera is not ready
-    # This prevents the generator from blocking indefinitely and allows
-    # the server to detect if the client has disconnected.
+    Published when a camera is not ready so viewers keep receiving data
+    (and disconnects are detected). Built once at import.
+    """
     placeholder = np.zeros((480, 848, 3), dtype=np.uint8)
     # Dark grey background
     placeholder[:] = (20, 20, 20)
@@ -206,56 +294,173 @@ def gen_frames(camera_id: int):
     text_x = (848 - text_w) // 2
     text_y = (480 + text_h) // 2
     cv2.putText(placeholder, text, (text_x, text_y), font, font_scale, (150, 150, 150), thickness)
-    
-    _, ph_buffer = cv2.imencode('.jpg', placeholder, [cv2.IMWRITE_JPEG_QUALITY, 60])
-    ph_bytes = (b'--frame\r\nContent-Type: image/jpeg\r\n\r\n' + ph_buffer.tobytes() + b'\r\n')
 
-    while True:
-        # Determine target FPS based on recording state
-        is_recording = recording_state["status"] in ("recording", "warming_up", "paused")
-        target_fps = STREAM_FPS_RECORDING if is_recording else STREAM_FPS_IDLE
-        frame_interval = 1.0 / target_fps
+    return _MJPEG_PART_HEAD + _encode_jpeg(placeholder, 60) + _MJPEG_PART_TAIL
 
-        frame_start = time.monotonic()
 
-        # Re-evaluate every frame so a camera swap is picked up immediately
-        physical_id = get_physical_camera_id(camera_id)
-        camera = get_camera_source(physical_id)
+_PLACEHOLDER_CHUNK = _render_placeholder_chunk()
 
-        frame = None
 
-        if camera.is_running():
-            ret, frame, depth = camera.read()
-            if ret and frame is not None:
-                last_good_frame = frame
-            else:
+class FrameHub:
+    """
+    Shares one encoded MJPEG stream of a logical camera between all viewers.
+
+    A single producer thread reads and JPEG-encodes each frame once, then
+    publishes the multipart chunk under a Condition with an increasing
+    sequence number. Every gen_frames() subscriber waits for the next
+    sequence number and yields the shared bytes, so N viewers cost one
+    encode per frame instead of N. The producer starts with the first
+    subscriber and exits once the last one has gone.
+    """
+
+    def __init__(self, camera_id: int):
+        self.camera_id = camera_id
+        self.cond = threading.Condition()
+        self.seq = 0
+        self.chunk = None
+        self.subscribers = 0
+        self._thread = None
+
+    def subscribe(self):
+        with self.cond:
+            self.subscribers += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name=f"frame-hub-{self.camera_id}"
+                )
+                self._thread.start()
+
+    def unsubscribe(self):
+        with self.cond:
+            self.subscribers -= 1
+
+    def wait_next(self, last_seq: int, timeout: float = 1.0):
+        """
+        Block until a chunk newer than last_seq is published.
+
+        Returns (seq, chunk). On timeout the current chunk is returned again,
+        which keeps idle connections alive and lets disconnects surface.
+        """
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq != last_seq, timeout)
+            return self.seq, self.chunk
+
+    def _publish(self, chunk: bytes):
+        with self.cond:
+            self.chunk = chunk
+            self.seq += 1
+            self.cond.notify_all()
+
+    def _run(self):
+        """Producer loop: read → encode → publish, throttled to the preview FPS."""
+        last_good_frame = None
+        # One color buffer per hub, refilled in place by read_color(out=...).
+        # Safe to reuse: each frame is encoded before the next read.
+        frame_buf = None
+
+        # Bind per-frame callables/constants once; the loop runs at stream FPS
+        # for as long as anyone is watching
+        cond = self.cond
+        publish = self._publish
+        encode = _encode_jpeg
+        monotonic = time.monotonic
+        sleep = time.sleep
+        head, tail = _MJPEG_PART_HEAD, _MJPEG_PART_TAIL
+
+        # Fixed-cadence schedule: each frame is due one period after the
+        # previous deadline, so read/encode time doesn't add up as drift
+        deadline = monotonic()
+
+        while True:
+            with cond:
+                if self.subscribers <= 0:
+                    self._thread = None
+                    return
+
+            # Determine target FPS based on recording state
+            is_recording = recording_state.status in ("recording", "warming_up", "paused")
+            target_fps = STREAM_FPS_RECORDING if is_recording else STREAM_FPS_IDLE
+            frame_interval = 1.0 / target_fps
+
+            # Re-evaluate every frame so a camera swap is picked up immediately
+            physical_id = get_physical_camera_id(self.camera_id)
+            camera = get_camera_source(physical_id)
+
+            frame = None
+
+            try:
+                if camera.is_running():
+                    ret, frame = camera.read_color(out=frame_buf)
+                    if ret and frame is not None:
+                        frame_buf = last_good_frame = frame
+                    else:
+                        frame = last_good_frame
+                else:
+                    # Camera not running — serve last good frame (or wait)
+                    frame = last_good_frame
+            except Exception as e:
+                # Keep the producer alive for the other viewers (e.g. mid-restart)
+                print(f"[Stream] Camera {self.camera_id} read error: {e}")
                 frame = last_good_frame
-        else:
-            # Camera not running — serve last good frame (or wait)
-            frame = last_good_frame
 
-        if frame is None:
-            # No frame yet (camera still starting) — serve placeholder
+            if frame is None:
+                # No frame yet (camera still starting) — serve placeholder,
+                # a bit slower than the normal frame interval to save bandwidth
+                publish(_PLACEHOLDER_CHUNK)
+                sleep(0.5)
+                deadline = monotonic()
+                continue
+
             try:
-                yield ph_bytes
-                # Sleep a bit longer than normal frame interval to save bandwidth
-                time.sleep(0.5)
-            except (GeneratorExit, OSError):
-                # Client disconnected — clean exit
-                break
-            continue
+                publish(head + encode(frame) + tail)
+            except Exception as e:
+                print(f"[Stream] Camera {self.camera_id} encode error: {e}")
+
+            deadline += frame_interval
+            delay = deadline - monotonic()
+            if delay > 0:
+                sleep(delay)
+            else:
+                # Fell behind (slow read/encode) — resync instead of bursting
+                deadline = monotonic()
+
+
+frame_hubs: Dict[int, FrameHub] = {}
+frame_hubs_lock = threading.Lock()
 
-        try:
-            _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
-            yield (b'--frame\r\nContent-Type: image/jpeg\r\n\r\n' + buffer.tobytes() + b'\r\n')
-        except (GeneratorExit, OSError):
-            # Client disconnected (navigated away) — clean exit
-            break
 
-        elapsed = time.monotonic() - frame_start
-        sleep_time = frame_interval - elapsed
-        if sleep_time > 0:
-            time.sleep(sleep_time)
+def get_frame_hub(camera_id: int) -> FrameHub:
+    """Get (or create) the shared frame hub for a logical camera."""
+    with frame_hubs_lock:
+        hub = frame_hubs.get(camera_id)
+        if hub is None:
+            hub = frame_hubs[camera_id] = FrameHub(camera_id)
+        return hub
+
+
+def gen_frames(camera_id: int):
+    """
+    Generate MJPEG frames from a camera.
+
+    This stream lives as long as the HTTP connection does — it NEVER
+    closes voluntarily.  Frames come from the camera's shared FrameHub;
+    if the camera is offline or restarting, the hub publishes a placeholder
+    frame to keep the connection alive and allow detection of client
+    disconnects (via write errors).
+    """
+    hub = get_frame_hub(camera_id)
+    hub.subscribe()
+    seq = 0
+    try:
+        while True:
+            seq, chunk = hub.wait_next(seq)
+            if chunk is not None:
+                yield chunk
+    except (GeneratorExit, OSError):
+        # Client disconnected (navigated away) — clean exit
+        pass
+    finally:
+        hub.unsubscribe()
 
 
 # =============================================================================
@@ -322,6 +527,7 @@ def _prepare_camera_recording(cam_id: int, timestamp_str: str, prepared_dict: di
     prepared_dict[cam_id] = {
         "prepared": prepared,
         "bag_filename": bag_filename,
+        "bag_path": bag_filepath,
         "camera_type": camera_type,
         "actual_fps": actual_fps,
         "prepare_ms": prepare_ms,
@@ -371,6 +577,7 @@ def _commit_camera_recording(cam_id: int, prepared_info: dict, barrier: threadin
 
     result_dict[cam_id] = {
         "bag_filename": prepared_info["bag_filename"] if bag_success else None,
+        "bag_path": prepared_info["bag_path"] if bag_success else None,
         "bag_success": bag_success,
         "camera_type": prepared_info["camera_type"],
         "actual_fps": prepared_info["actual_fps"],
@@ -398,10 +605,10 @@ def _initialize_recording():
     <100ms (the difference in pipeline.start() time between cameras).
     """
     with recording_lock:
-        if recording_state["status"] != "warming_up":
+        if recording_state.status != "warming_up":
             print("[Recording] Warm-up cancelled before recording started")
             return
-        timestamp_str = recording_state["timestamp_str"]
+        timestamp_str = recording_state.timestamp_str
 
     # ── Phase 1: PREPARE both cameras in parallel ──
     prepared_dict: dict = {}
@@ -427,8 +634,8 @@ def _initialize_recording():
     if not ready_cams:
         print("[Recording] No cameras ready for recording")
         with recording_lock:
-            if recording_state["status"] == "warming_up":
-                recording_state["status"] = "idle"
+            if recording_state.status == "warming_up":
+                recording_state.status = "idle"
         return
 
     # ── Phase 2: COMMIT all cameras simultaneously via barrier ──
@@ -450,47 +657,53 @@ def _initialize_recording():
     # Drop cameras that failed to commit
     cam_info = {k: v for k, v in cam_info.items() if v is not None}
 
+    # Compute inter-camera start offset using monotonic timestamps
+    start_monos = {
+        cid: info["recording_start_mono"]
+        for cid, info in cam_info.items()
+        if info.get("recording_start_mono") is not None
+    }
+    inter_camera_offset_ms = 0.0
+    if len(start_monos) == 2:
+        vals = list(start_monos.values())
+        inter_camera_offset_ms = round(abs(vals[0] - vals[1]) * 1000, 1)
+        print(f"[Recording] Inter-camera start offset: {inter_camera_offset_ms}ms")
+
+    # Only the state hand-off happens under the lock
     with recording_lock:
-        if recording_state["status"] != "warming_up":
-            # Cancelled during startup — stop any BAG pipelines that started
+        cancelled = recording_state.status != "warming_up"
+        if not cancelled:
             for cam_id, info in cam_info.items():
-                if info.get("bag_success"):
-                    try:
-                        get_camera_source(get_physical_camera_id(cam_id)).stop_recording()
-                    except Exception:
-                        pass
-            print("[Recording] Warm-up cancelled during recording startup")
-            return
+                recording_state.writers_bag[cam_id] = info["bag_success"]
+                recording_state.filenames_bag[cam_id] = info["bag_filename"]
+                recording_state.paths_bag[cam_id] = info["bag_path"]
+                recording_state.camera_types[cam_id] = info["camera_type"]
+                recording_state.fps_per_cam[cam_id] = info["actual_fps"]
+
+            recording_state.recording_start_times = {
+                cid: info.get("recording_start_iso") for cid, info in cam_info.items()
+            }
+            recording_state.inter_camera_offset_ms = inter_camera_offset_ms
+            recording_state.pipeline_restart_ms = {
+                cid: info.get("pipeline_restart_ms", 0) for cid, info in cam_info.items()
+            }
+
+            recording_state.status = "recording"
+            recording_state.start_time = datetime.now()
 
+    if cancelled:
+        # Cancelled during startup — stop any BAG pipelines that started
+        # (outside the lock: pipeline.stop() can take hundreds of ms)
         for cam_id, info in cam_info.items():
-            recording_state["writers_bag"][cam_id] = info["bag_success"]
-            recording_state["filenames_bag"][cam_id] = info["bag_filename"]
-            recording_state["camera_types"][cam_id] = info["camera_type"]
-            recording_state["fps_per_cam"][cam_id] = info["actual_fps"]
-
-        # Compute inter-camera start offset using monotonic timestamps
-        start_monos = {
-            cid: info["recording_start_mono"]
-            for cid, info in cam_info.items()
-            if info.get("recording_start_mono") is not None
-        }
-        inter_camera_offset_ms = 0.0
-        if len(start_monos) == 2:
-            vals = list(start_monos.values())
-            inter_camera_offset_ms = round(abs(vals[0] - vals[1]) * 1000, 1)
-            print(f"[Recording] Inter-camera start offset: {inter_camera_offset_ms}ms")
-
-        recording_state["recording_start_times"] = {
-            cid: info.get("recording_start_iso") for cid, info in cam_info.items()
-        }
-        recording_state["inter_camera_offset_ms"] = inter_camera_offset_ms
-        recording_state["pipeline_restart_ms"] = {
-            cid: info.get("pipeline_restart_ms", 0) for cid, info in cam_info.items()
-        }
+            if info.get("bag_success"):
+                try:
+                    get_camera_source(get_physical_camera_id(cam_id)).stop_recording()
+                except Exception:
+                    pass
+        print("[Recording] Warm-up cancelled during recording startup")
+        return
 
-        recording_state["status"] = "recording"
-        recording_state["start_time"] = datetime.now()
-        print(f"[Recording] Recording started (barrier-synced, offset: {inter_camera_offset_ms}ms)")
+    print(f"[Recording] Recording started (barrier-synced, offset: {inter_camera_offset_ms}ms)")
 
 
 @app.post("/recording/start")
@@ -511,12 +724,12 @@ def start_recording(data: RecordingStartRequest = None):
         patient_id = re.sub(r'[^\w\-_]', '', data.patientId.strip())
 
     with recording_lock:
-        if recording_state["status"] in ("recording", "warming_up", "paused"):
+        if recording_state.status in ("recording", "warming_up", "paused"):
             return JSONResponse(
                 status_code=409,
                 content={
                     "error": "A recording is already in progress",
-                    "status": recording_state["status"]
+                    "status": recording_state.status
                 }
             )
 
@@ -524,14 +737,17 @@ def start_recording(data: RecordingStartRequest = None):
     timestamp_str = timestamp.strftime("%Y-%m-%d_%H-%M-%S")
 
     with recording_lock:
-        recording_state["timestamp_str"] = timestamp_str
-        recording_state["patient_id"] = patient_id
-        recording_state["warmup_start"] = timestamp
-        recording_state["status"] = "warming_up"
+        recording_state.timestamp_str = timestamp_str
+        recording_state.patient_id = patient_id
+        recording_state.warmup_start = timestamp
+        recording_state.status = "warming_up"
+        _warmup_cancel.clear()
 
     def warmup_then_record():
         """Wait for warm-up then initialize writers and start recording."""
-        time.sleep(WARMUP_DURATION)
+        if _warmup_cancel.wait(WARMUP_DURATION):
+            print("[Recording] Warm-up thread exiting (cancelled)")
+            return
         print("[Recording] Warm-up complete, initializing writers...")
         _initialize_recording()
 
@@ -554,16 +770,16 @@ def pause_recording():
     so the resulting BAG has no gap/filler frames.
     """
     with recording_lock:
-        if recording_state["status"] != "recording":
-            return {"status": recording_state["status"], "message": "Not recording"}
-        recording_state["status"] = "paused"
+        if recording_state.status != "recording":
+            return {"status": recording_state.status, "message": "Not recording"}
+        recording_state.status = "paused"
+        active_cams = [c for c, ok in recording_state.writers_bag.items() if ok]
 
     # Pause BAG recording on all active cameras (outside lock to avoid blocking)
-    for cam_id in list(recording_state["writers_bag"].keys()):
-        if recording_state["writers_bag"].get(cam_id):
-            physical_cam = get_camera_source(get_physical_camera_id(cam_id))
-            if not physical_cam.pause_recording():
-                print(f"[Recording] Warning: failed to pause BAG on cam {cam_id}")
+    for cam_id in active_cams:
+        physical_cam = get_camera_source(get_physical_camera_id(cam_id))
+        if not physical_cam.pause_recording():
+            print(f"[Recording] Warning: failed to pause BAG on cam {cam_id}")
 
     return {"status": "paused", "message": "Recording paused (BAG writing stopped)"}
 
@@ -577,22 +793,22 @@ def resume_recording():
     resume offset.
     """
     with recording_lock:
-        if recording_state["status"] != "paused":
-            return {"status": recording_state["status"], "message": "Not paused"}
-        recording_state["status"] = "recording"
+        if recording_state.status != "paused":
+            return {"status": recording_state.status, "message": "Not paused"}
+        recording_state.status = "recording"
+        active_cams = [c for c, ok in recording_state.writers_bag.items() if ok]
 
-    # Resume BAG recording on all active cameras
-    for cam_id in list(recording_state["writers_bag"].keys()):
-        if recording_state["writers_bag"].get(cam_id):
-            physical_cam = get_camera_source(get_physical_camera_id(cam_id))
-            if not physical_cam.resume_recording():
-                print(f"[Recording] Warning: failed to resume BAG on cam {cam_id}")
+    # Resume BAG recording on all active cameras (outside lock to avoid blocking)
+    for cam_id in active_cams:
+        physical_cam = get_camera_source(get_physical_camera_id(cam_id))
+        if not physical_cam.resume_recording():
+            print(f"[Recording] Warning: failed to resume BAG on cam {cam_id}")
 
     return {"status": "recording", "message": "Recording resumed"}
 
 
 @app.post("/recording/stop")
-def stop_recording(data: RecordingStopRequest = None):
+async def stop_recording(data: RecordingStopRequest = None):
     """
     Stop recording and save BAG files with metadata sidecars.
 
@@ -608,19 +824,12 @@ def stop_recording(data: RecordingStopRequest = None):
     fps_per_cam = {}
 
     with recording_lock:
-        if recording_state["status"] == "idle":
+        if recording_state.status == "idle":
             return {"status": "idle", "message": "No recording is active"}
 
-        if recording_state["status"] == "warming_up":
-            recording_state["status"] = "idle"
-            recording_state["warmup_start"] = None
-            recording_state["timestamp_str"] = None
-            recording_state["camera_types"] = {}
-            recording_state["fps_per_cam"] = {}
-            recording_state["patient_id"] = ""
-            recording_state["recording_start_times"] = {}
-            recording_state["inter_camera_offset_ms"] = 0.0
-            recording_state["pipeline_restart_ms"] = {}
+        if recording_state.status == "warming_up":
+            _warmup_cancel.set()
+            recording_state.reset()
             print("[Recording] Warm-up cancelled by stop request")
             return {
                 "status": "idle",
@@ -629,29 +838,21 @@ def stop_recording(data: RecordingStopRequest = None):
                 "path": str(RECORDINGS_DIR)
             }
 
-        # Atomically read all state and clear in one lock acquisition
-        patient_id = recording_state.get("patient_id", "")
-        camera_types = recording_state.get("camera_types", {}).copy()
-        fps_per_cam = recording_state.get("fps_per_cam", {}).copy()
-        writers_bag = dict(recording_state["writers_bag"])
-        filenames_bag = dict(recording_state["filenames_bag"])
-        inter_camera_offset_ms = recording_state.get("inter_camera_offset_ms", 0.0)
-        recording_start_times = recording_state.get("recording_start_times", {}).copy()
-        pipeline_restart_ms = recording_state.get("pipeline_restart_ms", {}).copy()
+        # Atomically read all state and clear in one lock acquisition.
+        # reset() swaps in fresh per-camera dicts, so the old ones taken
+        # here are an exclusive snapshot — no copies needed.
+        patient_id = recording_state.patient_id
+        camera_types = recording_state.camera_types
+        fps_per_cam = recording_state.fps_per_cam
+        writers_bag = recording_state.writers_bag
+        filenames_bag = recording_state.filenames_bag
+        paths_bag = recording_state.paths_bag
+        inter_camera_offset_ms = recording_state.inter_camera_offset_ms
+        recording_start_times = recording_state.recording_start_times
+        pipeline_restart_ms = recording_state.pipeline_restart_ms
 
         # Clear state immediately to prevent concurrent operations
-        recording_state["status"] = "idle"
-        recording_state["start_time"] = None
-        recording_state["warmup_start"] = None
-        recording_state["timestamp_str"] = None
-        recording_state["writers_bag"] = {}
-        recording_state["filenames_bag"] = {}
-        recording_state["camera_types"] = {}
-        recording_state["fps_per_cam"] = {}
-        recording_state["patient_id"] = ""
-        recording_state["recording_start_times"] = {}
-        recording_state["inter_camera_offset_ms"] = 0.0
-        recording_state["pipeline_restart_ms"] = {}
+        recording_state.reset()
 
     # ----- Stop BAG recordings in PARALLEL -----
     stop_timestamps: dict = {}  # cam_id -> ISO timestamp when recording actually stopped
@@ -670,89 +871,80 @@ def stop_recording(data: RecordingStopRequest = None):
 
         bag_filename = filenames_bag.get(cam_id)
         if bag_filename:
-            filepath = RECORDINGS_DIR / bag_filename
+            filepath = paths_bag.get(cam_id) or os.path.join(str(RECORDINGS_DIR), bag_filename)
+            # One stat: it both proves existence and gives the size
             try:
-                exists = filepath.exists()
-                size = filepath.stat().st_size if exists else 0
-                print(f"[Recording] BAG {bag_filename}: exists={exists}, size={size}")
-                if exists and size > 0:
-                    bag_files.append(bag_filename)
+                size = os.stat(filepath).st_size
+            except FileNotFoundError:
+                print(f"[Recording] BAG {bag_filename}: exists=False, size=0")
             except OSError as e:
                 print(f"[Recording] Error checking BAG file {bag_filename}: {e}")
+            else:
+                print(f"[Recording] BAG {bag_filename}: exists=True, size={size}")
+                if size > 0:
+                    bag_files.append(bag_filename)
 
-    stop_threads = [
-        threading.Thread(target=_stop_cam_resources, args=(c,), daemon=True)
-        for c in list(writers_bag.keys())
-    ]
-    for t in stop_threads:
-        t.start()
-    for t in stop_threads:
-        t.join()
+    # Pipeline stops block for hundreds of ms — run them on worker threads
+    # (concurrently, to keep the inter-camera stop offset small)
+    await asyncio.gather(*(
+        _run_blocking(_stop_cam_resources, c) for c in list(writers_bag.keys())
+    ))
 
-    # ----- Rename BAG files with Note and CF/CS -----
     note = data.note.strip() if data and data.note else ""
     # Sanitize note
     safe_note = re.sub(r'[^\w\-_]', '', note)
-    
+
     # Sanitize patient_id (ensure filename safety)
     safe_patient_id = re.sub(r'[^\w\-_]', '', patient_id) if patient_id else ""
-    
-    renamed_bag_files = []
-    
-    for bag_file in bag_files:
+
+    def _finalize_bag_file(bag_file: str) -> str:
+        """Rename one BAG with CF/CS + patient + note and write its sidecar; returns the final name."""
         old_path = RECORDINGS_DIR / bag_file
-        
+
         # Parse timestamp and camera
         # Expected format: YYYY-MM-DD_HH-MM-SS_cameraX.bag
-        parts = bag_file.split('_camera')
-        if len(parts) == 2:
-            timestamp_part = parts[0]
-            cam_suffix = parts[1] # "1.bag" or "2.bag"
-            
-            cam_label = "CF" if cam_suffix.startswith("1") else "CS"
-            
+        m = _RAW_BAG_RE.match(bag_file)
+        if m:
+            timestamp_part = m.group("batch")
+            cam_label = "CF" if m.group("n") == "1" else "CS"
+
             # Construct filename: {timestamp}_{CF/CS}_{patient_id}_{note}.bag
             components = [timestamp_part, cam_label]
             if safe_patient_id:
                 components.append(safe_patient_id)
             if safe_note:
                 components.append(safe_note)
-                
+
             new_filename = "_".join(components) + ".bag"
-                
+
             new_path = RECORDINGS_DIR / new_filename
-            
+
             try:
                 os.rename(old_path, new_path)
                 print(f"[Recording] Renamed {bag_file} -> {new_filename}")
-                renamed_bag_files.append(new_filename)
+                bag_file = new_filename
             except OSError as e:
-                print(f"[Recording] Rename failed for {bag_file}: {e}")
-                renamed_bag_files.append(bag_file) # Keep old name if fail
-        else:
-            renamed_bag_files.append(bag_file)
-
-    bag_files = renamed_bag_files
+                print(f"[Recording] Rename failed for {bag_file}: {e}")  # Keep old name
 
-    # Save metadata sidecar for each BAG file — includes sync tracking data
-    # and hardware timestamps for post-hoc alignment
-    for bag_file in bag_files:
+        # Save metadata sidecar — includes sync tracking data
+        # and hardware timestamps for post-hoc alignment
         base_name = bag_file.replace('.bag', '')
         metadata_file = f"{base_name}_metadata.json"
         metadata_path = RECORDINGS_DIR / metadata_file
 
-        if '_CF' in base_name or '_camera1' in base_name:
+        parsed = _parse_batch_name(base_name)
+        if parsed is None:
+            cam_id = -1
+            camera_view = "Unknown"
+        elif parsed[1] == "1":
             cam_id = 0
             camera_view = "Front"
-        elif '_CS' in base_name or '_camera2' in base_name:
+        else:
             cam_id = 1
             camera_view = "Side"
-        else:
-            cam_id = -1
-            camera_view = "Unknown"
 
         cam_type = camera_types.get(cam_id, CAMERA_TYPE_REALSENSE)
-        
+
         # Read hardware timestamps from camera for post-hoc sync alignment
         physical_cam = get_camera_source(get_physical_camera_id(cam_id))
         first_hw_ts = physical_cam.get_first_hw_timestamp()
@@ -789,8 +981,15 @@ def stop_recording(data: RecordingStopRequest = None):
             "processing_duration_s": None,
             "total_duration_s": None,
         }
-        metadata_path.write_text(json.dumps(metadata_content, indent=2))
+        write_json_file(metadata_path, metadata_content)
         print(f"[Recording] Metadata saved: {metadata_file}")
+        return bag_file
+
+    # ----- Rename BAG files with Note and CF/CS, write sidecars (one thread per file) -----
+    bag_files = list(await asyncio.gather(*(
+        _run_blocking(_finalize_bag_file, bag_file) for bag_file in bag_files
+    )))
+    _invalidate_listing_caches()
 
     return {
         "status": "idle",
@@ -801,7 +1000,7 @@ def stop_recording(data: RecordingStopRequest = None):
 
 
 @app.get("/recording/status")
-def get_recording_status():
+async def get_recording_status():
     """
     Get current recording status with live metrics.
 
@@ -811,34 +1010,36 @@ def get_recording_status():
         warmup_remaining:  seconds left in warm-up countdown (None when not warming up)
         current_filenames: dict of "camN_bag" -> filename (populated after warm-up)
     """
+    # Snapshot under the lock; derive durations and build the response after release
     with recording_lock:
-        status = recording_state["status"]
-        start_time = recording_state["start_time"]
-        warmup_start = recording_state["warmup_start"]
+        status = recording_state.status
+        start_time = recording_state.start_time
+        warmup_start = recording_state.warmup_start
+        patient_id = recording_state.patient_id
+        filenames_bag = dict(recording_state.filenames_bag)
 
-        duration = None
-        warmup_remaining = None
+    duration = None
+    warmup_remaining = None
 
-        if status == "recording" and start_time:
-            duration = (datetime.now() - start_time).total_seconds()
+    if status == "recording" and start_time:
+        duration = (datetime.now() - start_time).total_seconds()
 
-        if status == "warming_up" and warmup_start:
-            elapsed = (datetime.now() - warmup_start).total_seconds()
-            warmup_remaining = max(0.0, WARMUP_DURATION - elapsed)
+    if status == "warming_up" and warmup_start:
+        elapsed = (datetime.now() - warmup_start).total_seconds()
+        warmup_remaining = max(0.0, WARMUP_DURATION - elapsed)
 
-        current_filenames: dict = {}
-        for cam_id, fname in recording_state["filenames_bag"].items():
-            if fname:
-                current_filenames[f"cam{cam_id}_bag"] = fname
+    current_filenames = {
+        f"cam{cam_id}_bag": fname for cam_id, fname in filenames_bag.items() if fname
+    }
 
-        return {
-            "status": status,
-            "patient_id": recording_state["patient_id"],
-            "start_time": start_time.isoformat() if start_time else None,
-            "duration": duration,
-            "warmup_remaining": warmup_remaining,
-            "current_filenames": current_filenames,
-        }
+    return {
+        "status": status,
+        "patient_id": patient_id,
+        "start_time": start_time.isoformat() if start_time else None,
+        "duration": duration,
+        "warmup_remaining": warmup_remaining,
+        "current_filenames": current_filenames,
+    }
 
 
 # =============================================================================
@@ -846,7 +1047,7 @@ def get_recording_status():
 # =============================================================================
 
 @app.get("/system/info")
-def get_system_info():
+async def get_system_info():
     """Get system information and capabilities."""
     return {
         "camera_mode": CAMERA_MODE,
@@ -912,7 +1113,7 @@ def restart_cameras():
 
 
 @app.post("/cameras/swap")
-def swap_cameras():
+async def swap_cameras():
     """
     Toggle the logical↔physical camera swap.
 
@@ -930,13 +1131,13 @@ def swap_cameras():
 
 
 @app.get("/cameras/swap-state")
-def get_cameras_swap_state():
+async def get_cameras_swap_state():
     """Return the current camera swap state."""
     return {"is_swapped": SWAP_CAMERAS}
 
 
 @app.get("/health")
-def health():
+async def health():
     """Health check endpoint."""
     return {"status": "ok"}
 
@@ -951,36 +1152,268 @@ def shutdown():
 #                         VIDEO LISTING & SERVING
 # =============================================================================
 
+# Directories with at least this many files get their stats fanned out over
+# _STAT_POOL. stat() releases the GIL, so on slow or network-mounted storage
+# the per-file latencies overlap; small local dirs stay serial (no pool hop).
+_STAT_FANOUT_MIN = 256
+_STAT_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="stat")
+
+
+def _entry_stat(entry: os.DirEntry) -> Optional[os.stat_result]:
+    """DirEntry.stat() that returns None instead of raising (file vanished, EACCES)."""
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+def _scan_dir(directory) -> Dict[str, os.stat_result]:
+    """Single os.scandir pass: {filename: stat_result} for regular files."""
+    try:
+        with os.scandir(directory) as it:
+            # is_file() uses d_type from the directory read — no syscall on Linux
+            entries = [entry for entry in it if entry.is_file()]
+    except FileNotFoundError:
+        return {}
+
+    if len(entries) >= _STAT_FANOUT_MIN:
+        stats = _STAT_POOL.map(_entry_stat, entries)
+    else:
+        stats = map(_entry_stat, entries)
+    return {entry.name: st for entry, st in zip(entries, stats) if st is not None}
+
+
+# Recording file stems:
+#   Old: YYYY-MM-DD_HH-MM-SS_camera1
+#   New: YYYY-MM-DD_HH-MM-SS_CF_{patient_id}_{note}
+_BATCH_RE = re.compile(r'^(.*?)_(camera1|camera2|CF|CS)(?:_.*)?$')
+
+# BAG name as written by the recorder, before stop_recording renames it
+_RAW_BAG_RE = re.compile(r'^(?P<batch>.+)_camera(?P<n>[12])\.bag$')
+
+
+def _parse_batch_name(stem: str):
+    """
+    Split a recording file stem into (batch_id, camera_num).
+
+    camera_num is "1" (camera1/CF) or "2" (camera2/CS). Returns None if the
+    stem doesn't follow either naming scheme.
+    """
+    m = _BATCH_RE.match(stem)
+    if not m:
+        return None
+    return m.group(1), "1" if m.group(2) in ("camera1", "CF") else "2"
+
+
+_EMPTY_SIDECAR = MappingProxyType({})
+
+
+def _read_sidecar(path_str: str, mtime_ns: int):
+    """
+    Parse a *_metadata.json sidecar.
+
+    Successful parses are cached on (path, mtime_ns): sidecars are written
+    once at stop time (and rewritten after conversion, which bumps the mtime),
+    so repeat listings skip the read + parse. Failures (e.g. a read landing
+    mid-write) are not cached, so the next listing retries. Returns a
+    read-only mapping (shared between callers); empty on error.
+    """
+    try:
+        return _read_sidecar_cached(path_str, mtime_ns)
+    except Exception:
+        return _EMPTY_SIDECAR
+
+
+@lru_cache(maxsize=4096)
+def _read_sidecar_cached(path_str: str, mtime_ns: int):
+    """Cached body of _read_sidecar; raises on failure (exceptions aren't cached)."""
+    with open(path_str, 'rb') as fp:
+        return MappingProxyType(_json_loads(fp.read()))
+
+
+def _load_sidecar(path) -> Optional[MappingProxyType]:
+    """Stat a sidecar and return its cached parse; None if the file doesn't exist."""
+    path_str = str(path)
+    try:
+        mtime_ns = os.stat(path_str).st_mtime_ns
+    except OSError:
+        return None
+    return _read_sidecar(path_str, mtime_ns)
+
+
+_SIDECAR_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="sidecar")
+
+
+def _read_sidecar_job(job: tuple):
+    """(target, path_str, mtime_ns) -> parsed sidecar, for _SIDECAR_POOL.map."""
+    return _read_sidecar(job[1], job[2])
+
+
+@lru_cache(maxsize=16384)
+def _iso_mtime(mtime_s: int) -> str:
+    """
+    Format an mtime (whole seconds) as a local ISO-8601 string.
+
+    Cached: recordings cluster in time, so most listings hit the cache.
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(mtime_s))
+
+
+class RecordingsSnapshot:
+    """
+    One directory listing of RECORDINGS_DIR shared by a whole request.
+
+    Replaces repeated ``glob()`` / ``exists()`` / ``stat()`` calls with dict
+    lookups against a single ``os.scandir`` pass.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.directory_str = str(directory)
+        self.stat_by_name = _scan_dir(self.directory_str)
+        self.by_ext = {"mp4": [], "bag": [], "json": []}
+        for name in self.stat_by_name:
+            ext = name.rpartition('.')[2]
+            if ext in self.by_ext:
+                self.by_ext[ext].append(name)
+        # Recording stem -> sidecar name ("X_CF_p1" -> "X_CF_p1_metadata.json")
+        self.json_by_stem = {
+            name[:-len("_metadata.json")]: name
+            for name in self.by_ext["json"]
+            if name.endswith("_metadata.json")
+        }
+
+    def has(self, name: str) -> bool:
+        """Check whether a file exists in the snapshot."""
+        return name in self.stat_by_name
+
+    def path(self, name: str):
+        """Full path of a file in the snapshot directory."""
+        return self.directory / name
+
+    def path_str(self, name: str) -> str:
+        """Full path as a plain string (for cv2 / pyrealsense2 / open())."""
+        return os.path.join(self.directory_str, name)
+
+    def find(self, prefix: str, ext: str) -> list:
+        """Names starting with prefix and having the given extension (glob replacement)."""
+        return sorted(n for n in self.by_ext.get(ext, ()) if n.startswith(prefix))
+
+
+class _ListingCache:
+    """
+    Cache for a directory-listing response.
+
+    The cached value is reused while none of the watched directories' mtimes
+    changed and it is younger than ``ttl`` seconds. The TTL bounds staleness
+    for changes that don't touch the directory mtime (e.g. a file growing).
+    """
+
+    def __init__(self, *directories, ttl: float = 5.0):
+        self.directories = directories
+        self.ttl = ttl
+        self._key = None
+        self._value = None
+        self._ts = 0.0
+        # Bumped by invalidate(); a compute() that started before an
+        # invalidation must not store its (stale) result afterwards
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _dir_key(self) -> tuple:
+        key = []
+        for directory in self.directories:
+            try:
+                key.append(os.stat(directory).st_mtime_ns)
+            except OSError:
+                key.append(None)
+        return tuple(key)
+
+    async def aget(self, compute):
+        """
+        Return the cached value, or await compute() and cache its result.
+
+        compute is a coroutine function (or returns an awaitable); the mtime
+        check runs off the event loop.
+        """
+        with self._lock:
+            generation = self._generation
+        key = await _run_blocking(self._dir_key)
+        with self._lock:
+            if key == self._key and time.monotonic() - self._ts < self.ttl:
+                return self._value
+        # Compute outside the lock so a slow scan doesn't block other readers
+        value = await compute()
+        with self._lock:
+            if generation == self._generation:
+                self._key = key
+                self._value = value
+                self._ts = time.monotonic()
+        return value
+
+    def invalidate(self):
+        """Force the next aget() to recompute (and drop any scan already in flight)."""
+        with self._lock:
+            self._generation += 1
+            self._key = None
+
+
+def recordings_snapshot() -> RecordingsSnapshot:
+    """FastAPI dependency: fresh listing of RECORDINGS_DIR for this request."""
+    return RecordingsSnapshot(RECORDINGS_DIR)
+
+
+# Listing responses are reused until RECORDINGS_DIR changes (or 5s pass)
+_recordings_listing_cache = _ListingCache(RECORDINGS_DIR)
+_batches_listing_cache = _ListingCache(RECORDINGS_DIR)
+_files_listing_cache = _ListingCache(RECORDINGS_DIR, TAGGING_DIR, PROCESSED_DIR)
+
+
+def _invalidate_listing_caches():
+    """
+    Drop all cached listings after this process changed files.
+
+    Directory mtimes catch creates/renames/deletes on their own; this also
+    covers in-place rewrites (sidecar updates, re-encodes) and mtime
+    granularity, so the next poll shows the change instead of waiting out
+    the TTL.
+    """
+    for cache in (_recordings_listing_cache, _batches_listing_cache, _files_listing_cache):
+        cache.invalidate()
+
+
 @app.get("/recordings")
-def list_recordings():
+async def list_recordings():
     """List MP4 video files for tagging, including patient metadata."""
+    return await _recordings_listing_cache.aget(partial(_run_blocking, _list_recordings))
+
+
+def _list_recordings() -> dict:
+    """Build the /recordings response (blocking: scans the dir, reads sidecars)."""
+    snap = RecordingsSnapshot(RECORDINGS_DIR)
     files = []
 
-    for f in RECORDINGS_DIR.glob("*.mp4"):
-        metadata_path = RECORDINGS_DIR / f"{f.stem}_metadata.json"
+    for name in snap.by_ext["mp4"]:
+        stem = name[:-4]
+        metadata_name = f"{stem}_metadata.json"
         patient_name = ""
         patient_id = ""
         note = ""
-        if metadata_path.exists():
-            try:
-                meta = json.loads(metadata_path.read_text())
-                patient_name = meta.get("patient_name", "")
-                patient_id = meta.get("patient_id", "")
-                note = meta.get("note", "")
-            except Exception:
-                pass
+        if snap.has(metadata_name):
+            meta = _read_sidecar(snap.path_str(metadata_name),
+                                 snap.stat_by_name[metadata_name].st_mtime_ns)
+            patient_name = meta.get("patient_name", "")
+            patient_id = meta.get("patient_id", "")
+            note = meta.get("note", "")
 
-        if "_camera1" in f.stem or "_CF" in f.stem:
-            cam_type = "Front"
-        elif "_camera2" in f.stem or "_CS" in f.stem:
-            cam_type = "Side"
-        else:
-            cam_type = ""
+        parsed = _parse_batch_name(stem)
+        cam_type = ("Front" if parsed[1] == "1" else "Side") if parsed else ""
 
+        st = snap.stat_by_name[name]
         files.append({
-            "name": f.name,
-            "size": f.stat().st_size,
-            "modified": datetime.fromtimestamp(f.stat().st_mtime).isoformat(),
+            "name": name,
+            "size": st.st_size,
+            "modified": st.st_mtime,
             "format": "mp4",
             "patient_name": patient_name,
             "patient_id": patient_id,
@@ -988,12 +1421,15 @@ def list_recordings():
             "camera_type": cam_type,
         })
 
-    files.sort(key=lambda x: x["modified"], reverse=True)
+    # Sort on the raw float mtime, format to ISO only once at the end
+    files.sort(key=itemgetter("modified"), reverse=True)
+    for entry in files:
+        entry["modified"] = _iso_mtime(int(entry["modified"]))
     return {"files": files}
 
 
 @app.get("/recordings/batches")
-def list_batches():
+async def list_batches():
     """
     List recording batches (camera1 + camera2 pairs) and orphaned singles.
 
@@ -1002,69 +1438,54 @@ def list_batches():
 
     Returns MP4 names for viewing/tagging.
     """
-    bag_files = list(RECORDINGS_DIR.glob("*.bag"))
+    return await _batches_listing_cache.aget(partial(_run_blocking, _list_batches))
+
 
+def _list_batches() -> dict:
+    """Build the /recordings/batches response (blocking: scans the dir, reads sidecars)."""
+    snap = RecordingsSnapshot(RECORDINGS_DIR)
     batches: Dict[str, dict] = {}
 
-    for f in bag_files:
-        name = f.stem
-        # Try both formats:
-        # Old: YYYY-MM-DD_HH-MM-SS_camera1.bag
-        # New: YYYY-MM-DD_HH-MM-SS_CF_note.bag
-        
-        parts_old = name.rsplit('_camera', 1)
-        
-        batch_id = ""
-        camera_num = ""
-        
-        if len(parts_old) == 2:
-             batch_id = parts_old[0]
-             camera_num = parts_old[1] # "1" or "2"
-        else:
-             # Try new format
-             if "_CF" in name:
-                 parts_new = name.split('_CF')
-                 batch_id = parts_new[0]
-                 camera_num = "1"
-             elif "_CS" in name:
-                 parts_new = name.split('_CS')
-                 batch_id = parts_new[0]
-                 camera_num = "2"
-        
-        if batch_id and camera_num:
-            if batch_id not in batches:
-                batches[batch_id] = {
-                    "batch_id": batch_id,
-                    "camera1": None,
-                    "camera2": None,
-                    "camera1_hq": None,
-                    "camera2_hq": None,
-                    "camera1_has_mp4": False,
-                    "camera2_has_mp4": False,
-                    "camera1_type": None,
-                    "camera2_type": None,
-                    "complete": False,
-                    "orphaned": False,
-                    "type": "batch",
-                    "modified": None
-                }
+    for bag_name in snap.by_ext["bag"]:
+        name = bag_name[:-4]
+        parsed = _parse_batch_name(name)
+        if not parsed:
+            continue
+        batch_id, camera_num = parsed
+        if batch_id not in batches:
+            batches[batch_id] = {
+                "batch_id": batch_id,
+                "camera1": None,
+                "camera2": None,
+                "camera1_hq": None,
+                "camera2_hq": None,
+                "camera1_has_mp4": False,
+                "camera2_has_mp4": False,
+                "camera1_type": None,
+                "camera2_type": None,
+                "complete": False,
+                "orphaned": False,
+                "type": "batch",
+                "modified": None,
+                "_mtime_ns": 0,
+            }
 
-            mp4_file = RECORDINGS_DIR / f"{name}.mp4"
-            mp4_exists = mp4_file.exists()
-            if camera_num == "1":
-                batches[batch_id]["camera1_hq"] = f.name
-                batches[batch_id]["camera1"] = mp4_file.name if mp4_exists else f.name
-                batches[batch_id]["camera1_has_mp4"] = mp4_exists
-                batches[batch_id]["camera1_type"] = CAMERA_TYPE_REALSENSE
-            elif camera_num == "2":
-                batches[batch_id]["camera2_hq"] = f.name
-                batches[batch_id]["camera2"] = mp4_file.name if mp4_exists else f.name
-                batches[batch_id]["camera2_has_mp4"] = mp4_exists
-                batches[batch_id]["camera2_type"] = CAMERA_TYPE_REALSENSE
-
-            mtime = datetime.fromtimestamp(f.stat().st_mtime).isoformat()
-            if batches[batch_id]["modified"] is None or mtime > batches[batch_id]["modified"]:
-                batches[batch_id]["modified"] = mtime
+        mp4_name = f"{name}.mp4"
+        mp4_exists = snap.has(mp4_name)
+        if camera_num == "1":
+            batches[batch_id]["camera1_hq"] = bag_name
+            batches[batch_id]["camera1"] = mp4_name if mp4_exists else bag_name
+            batches[batch_id]["camera1_has_mp4"] = mp4_exists
+            batches[batch_id]["camera1_type"] = CAMERA_TYPE_REALSENSE
+        elif camera_num == "2":
+            batches[batch_id]["camera2_hq"] = bag_name
+            batches[batch_id]["camera2"] = mp4_name if mp4_exists else bag_name
+            batches[batch_id]["camera2_has_mp4"] = mp4_exists
+            batches[batch_id]["camera2_type"] = CAMERA_TYPE_REALSENSE
+
+        mtime_ns = snap.stat_by_name[bag_name].st_mtime_ns
+        if mtime_ns > batches[batch_id]["_mtime_ns"]:
+            batches[batch_id]["_mtime_ns"] = mtime_ns
 
     # Mark complete vs orphaned
     for batch in batches.values():
@@ -1075,53 +1496,40 @@ def list_batches():
         if batch["orphaned"]:
             batch["type"] = "orphan"
 
-    # Enrich with patient metadata from sidecar JSON
+    # Enrich with patient metadata from sidecar JSON (index lookups, no stats)
     for batch_id, batch in batches.items():
-        meta_path = None
-        
-        # Try to find metadata from actual bag filenames
-        if batch.get("camera1_hq"):
-             bag_name = batch["camera1_hq"]
-             # Strip extension
-             base_name = os.path.splitext(bag_name)[0]
-             possible_meta = RECORDINGS_DIR / f"{base_name}_metadata.json"
-             if possible_meta.exists():
-                 meta_path = possible_meta
-        
-        if not meta_path and batch.get("camera2_hq"):
-             bag_name = batch["camera2_hq"]
-             base_name = os.path.splitext(bag_name)[0]
-             possible_meta = RECORDINGS_DIR / f"{base_name}_metadata.json"
-             if possible_meta.exists():
-                 meta_path = possible_meta
-        
-        # Fallback to legacy naming if somehow not found
-        if not meta_path:
-            meta_path = RECORDINGS_DIR / f"{batch_id}_camera1_metadata.json"
-            if not meta_path.exists():
-                meta_path = RECORDINGS_DIR / f"{batch_id}_camera2_metadata.json"
-
-        batch["patient_name"] = ""
-        batch["patient_id"] = ""
-        batch["recorded_at"] = ""
-        batch["note"] = ""
-
-        if meta_path.exists():
-            try:
-                meta = json.loads(meta_path.read_text())
-                batch["patient_name"] = meta.get("patient_name", "")
-                batch["patient_id"] = meta.get("patient_id", "")
-                batch["recorded_at"] = meta.get("recorded_at", "")
-                batch["note"] = meta.get("note", "")
-            except Exception:
-                pass
+        meta_name = None
+        for bag_name in (batch["camera1_hq"], batch["camera2_hq"]):
+            if bag_name:
+                meta_name = snap.json_by_stem.get(bag_name[:-4])
+                if meta_name:
+                    break
 
-    result = sorted(batches.values(), key=lambda x: x["modified"] or "", reverse=True)
+        # Fallback to legacy naming if somehow not found
+        if not meta_name:
+            meta_name = (snap.json_by_stem.get(f"{batch_id}_camera1")
+                         or snap.json_by_stem.get(f"{batch_id}_camera2"))
+
+        meta = (_read_sidecar(snap.path_str(meta_name), snap.stat_by_name[meta_name].st_mtime_ns)
+                if meta_name else _EMPTY_SIDECAR)
+        batch["patient_name"] = meta.get("patient_name", "")
+        batch["patient_id"] = meta.get("patient_id", "")
+        batch["recorded_at"] = meta.get("recorded_at", "")
+        batch["note"] = meta.get("note", "")
+
+    # Sort on the integer mtime, then format ISO strings for the response
+    result = sorted(batches.values(), key=itemgetter("_mtime_ns"), reverse=True)
+    for batch in result:
+        batch["modified"] = _iso_mtime(batch.pop("_mtime_ns") // 1_000_000_000)
     return {"batches": result}
 
 
 @app.get("/recordings/frame-comparison/{batch_id}")
-def get_frame_comparison(batch_id: str):
+def get_frame_comparison(
+    batch_id: str,
+    fields: Optional[str] = None,
+    snap: RecordingsSnapshot = Depends(recordings_snapshot),
+):
     """
     Compare frame counts between BAG and MP4 files for a recording batch.
 
@@ -1129,34 +1537,46 @@ def get_frame_comparison(batch_id: str):
     were dropped between the high-quality BAG source and the MP4 preview, and
     whether both cameras have a similar (ideally equal) frame count.
 
-    BAG frame count is read from the metadata sidecar (saved at stop time).
-    MP4 frame count is read via OpenCV (or from the sidecar).
+    BAG frame count is read from the metadata sidecar (saved at stop time);
+    the BAG is only replayed when the sidecar has no frame count.
+    MP4 frame count is read from the moov atom (OpenCV fallback).
+
+    ``?fields=minimal`` leaves out the per-camera start/stop times and
+    hardware timestamps (only needed for post-hoc alignment).
     """
     import cv2 as _cv2
 
+    minimal = fields == "minimal"
+    _pipeline = None  # lazily created, shared by both cameras' BAG replays
+
     results = {}
 
     for cam_num in [1, 2]:
+        sidecar_fps = None
         cam_key = f"camera{cam_num}"
-        bag_path = RECORDINGS_DIR / f"{batch_id}_{cam_key}.bag"
-        mp4_path = RECORDINGS_DIR / f"{batch_id}_{cam_key}.mp4"
-        meta_path = RECORDINGS_DIR / f"{batch_id}_{cam_key}_metadata.json"
+        stem = f"{batch_id}_{cam_key}"
 
-        if not bag_path.exists() and not mp4_path.exists():
+        if not snap.has(f"{stem}.bag") and not snap.has(f"{stem}.mp4"):
             suffix = "CF" if cam_num == 1 else "CS"
-            candidates_bag = list(RECORDINGS_DIR.glob(f"{batch_id}_{suffix}*.bag"))
-            candidates_mp4 = list(RECORDINGS_DIR.glob(f"{batch_id}_{suffix}*.mp4"))
+            candidates_bag = snap.find(f"{batch_id}_{suffix}", "bag")
+            candidates_mp4 = snap.find(f"{batch_id}_{suffix}", "mp4")
             if candidates_bag:
-                bag_path = candidates_bag[0]
-                mp4_path = RECORDINGS_DIR / f"{bag_path.stem}.mp4"
-                meta_path = RECORDINGS_DIR / f"{bag_path.stem}_metadata.json"
+                stem = candidates_bag[0][:-4]
             elif candidates_mp4:
-                mp4_path = candidates_mp4[0]
-                meta_path = RECORDINGS_DIR / f"{mp4_path.stem}_metadata.json"
+                stem = candidates_mp4[0][:-4]
+
+        bag_name = f"{stem}.bag"
+        mp4_name = f"{stem}.mp4"
+        bag_exists = snap.has(bag_name)
+        mp4_exists = snap.has(mp4_name)
+        meta_name = f"{stem}_metadata.json"
+        # Plain strings — cv2 and pyrealsense2 take str, no Path round-trips
+        bag_path = snap.path_str(bag_name)
+        mp4_path = snap.path_str(mp4_name)
 
         cam_result = {
-            "bag_exists": bag_path.exists(),
-            "mp4_exists": mp4_path.exists(),
+            "bag_exists": bag_exists,
+            "mp4_exists": mp4_exists,
             "bag_frames": None,
             "mp4_frames": None,
             "mp4_frames_from_sidecar": None,
@@ -1168,59 +1588,89 @@ def get_frame_comparison(batch_id: str):
             "fps": DEFAULT_FPS,
         }
 
-        # Read FPS, sync data, and MP4 frame count from sidecar
-        if meta_path.exists():
+        # Read FPS, sync data, and MP4 frame count from sidecar (parsed once per mtime)
+        meta = (_read_sidecar(snap.path_str(meta_name), snap.stat_by_name[meta_name].st_mtime_ns)
+                if snap.has(meta_name) else _EMPTY_SIDECAR)
+        if meta:
             try:
-                meta = json.loads(meta_path.read_text())
+                sidecar_fps = meta.get("fps")
                 cam_result["fps"] = meta.get("fps", DEFAULT_FPS)
                 sidecar_mp4_frames = meta.get("mp4_frames")
                 if sidecar_mp4_frames:
                     cam_result["mp4_frames_from_sidecar"] = sidecar_mp4_frames
                 # Sync tracking data from recording
-                cam_result["recording_started_at"] = meta.get("recording_started_at")
-                cam_result["recording_stopped_at"] = meta.get("recording_stopped_at")
                 cam_result["inter_camera_offset_ms"] = meta.get("inter_camera_offset_ms", 0)
                 cam_result["pipeline_restart_ms"] = meta.get("pipeline_restart_ms", 0)
                 # True hardware FPS and drops
                 cam_result["bag_expected_frames"] = meta.get("expected_frames")
                 cam_result["bag_dropped_frames"] = meta.get("dropped_frames")
                 cam_result["real_fps"] = meta.get("real_fps")
-                # Hardware timestamps for post-hoc alignment
-                cam_result["first_hw_timestamp"] = meta.get("first_hw_timestamp")
-                cam_result["last_hw_timestamp"] = meta.get("last_hw_timestamp")
-                cam_result["hw_timestamp_domain"] = meta.get("hw_timestamp_domain")
                 cam_result["frames_at_stop"] = meta.get("frames_at_stop")
+                if not minimal:
+                    cam_result["recording_started_at"] = meta.get("recording_started_at")
+                    cam_result["recording_stopped_at"] = meta.get("recording_stopped_at")
+                    # Hardware timestamps for post-hoc alignment
+                    cam_result["first_hw_timestamp"] = meta.get("first_hw_timestamp")
+                    cam_result["last_hw_timestamp"] = meta.get("last_hw_timestamp")
+                    cam_result["hw_timestamp_domain"] = meta.get("hw_timestamp_domain")
             except Exception:
                 pass
 
-        # Count MP4 frames via OpenCV (authoritative, works on any MP4)
-        if mp4_path.exists():
-            try:
-                cap = _cv2.VideoCapture(str(mp4_path))
-                cam_result["mp4_frames"] = int(cap.get(_cv2.CAP_PROP_FRAME_COUNT))
-                if cam_result["fps"] == DEFAULT_FPS:
-                    reported_fps = cap.get(_cv2.CAP_PROP_FPS)
-                    if reported_fps > 0:
-                        cam_result["fps"] = reported_fps
-                cap.release()
-            except Exception as e:
-                cam_result["mp4_frames_error"] = str(e)
-
-        # Count BAG frames by replaying through pyrealsense2 with real-time
-        # disabled so the pipeline runs as fast as disk I/O allows.
-        # This is exact (not an estimate) but takes a few seconds on large files.
-        if bag_path.exists():
-            bag_size = bag_path.stat().st_size
-            mp4_size = mp4_path.stat().st_size if mp4_path.exists() else 0
+        # MP4 frame count: trust the sidecar when it has both frames and fps
+        # (written by the conversion pipeline after validating the output).
+        # Otherwise read the moov/stts atoms (a few KB read), and fall back to
+        # OpenCV for anything the atom reader can't parse (e.g. fragmented MP4)
+        if mp4_exists and cam_result["mp4_frames_from_sidecar"] and sidecar_fps:
+            cam_result["mp4_frames"] = cam_result["mp4_frames_from_sidecar"]
+        elif mp4_exists:
+            mp4_info = read_mp4_video_info(mp4_path)
+            if mp4_info is not None:
+                cam_result["mp4_frames"] = mp4_info["frames"]
+                if cam_result["fps"] == DEFAULT_FPS and mp4_info["fps"] > 0:
+                    cam_result["fps"] = mp4_info["fps"]
+            else:
+                try:
+                    # Force the FFmpeg backend so OpenCV doesn't probe others first
+                    cap = _cv2.VideoCapture(mp4_path, _cv2.CAP_FFMPEG)
+                    cap.setExceptionMode(False)
+                    cam_result["mp4_frames"] = int(cap.get(_cv2.CAP_PROP_FRAME_COUNT))
+                    if cam_result["fps"] == DEFAULT_FPS:
+                        reported_fps = cap.get(_cv2.CAP_PROP_FPS)
+                        if reported_fps > 0:
+                            cam_result["fps"] = reported_fps
+                    cap.release()
+                except Exception as e:
+                    cam_result["mp4_frames_error"] = str(e)
+
+        # BAG frame count: prefer what the sidecar recorded at stop time
+        # (frames_at_stop, or expected - dropped). Only when neither is there,
+        # replay the BAG through pyrealsense2 with real-time disabled so the
+        # pipeline runs as fast as disk I/O allows. The replay is exact but
+        # takes a few seconds on large files.
+        if bag_exists:
+            bag_size = snap.stat_by_name[bag_name].st_size
+            mp4_size = snap.stat_by_name[mp4_name].st_size if mp4_exists else 0
             cam_result["bag_size_mb"] = round(bag_size / (1024 * 1024), 1)
             cam_result["mp4_size_mb"] = round(mp4_size / (1024 * 1024), 1)
 
-            if REALSENSE_AVAILABLE and rs is not None:
+            sidecar_bag_frames = cam_result.get("frames_at_stop")
+            if not sidecar_bag_frames:
+                expected = cam_result["bag_expected_frames"]
+                dropped = cam_result["bag_dropped_frames"]
+                if expected and dropped is not None:
+                    sidecar_bag_frames = max(0, expected - dropped)
+
+            if sidecar_bag_frames:
+                cam_result["bag_frames"] = sidecar_bag_frames
+                cam_result["bag_frames_source"] = "sidecar"
+            elif REALSENSE_AVAILABLE and rs is not None:
                 try:
-                    _pipeline = rs.pipeline()
+                    # One pipeline object is reused for both cameras
+                    if _pipeline is None:
+                        _pipeline = rs.pipeline()
                     _config = rs.config()
                     rs.config.enable_device_from_file(
-                        _config, str(bag_path), repeat_playback=False
+                        _config, bag_path, repeat_playback=False
                     )
                     # Only need colour stream for counting
                     _config.enable_stream(rs.stream.color)
@@ -1230,14 +1680,23 @@ def get_frame_comparison(batch_id: str):
                     _playback = _profile.get_device().as_playback()
                     _playback.set_real_time(False)
 
+                    # Long timeout only until the first frame arrives; after that
+                    # EOF shows up as playback "stopped" or a few short timeouts,
+                    # instead of costing a full 2s wait at the end of every file.
                     bag_frame_count = 0
+                    misses = 0
                     while True:
-                        try:
-                            _frames = _pipeline.wait_for_frames(timeout_ms=2000)
+                        timeout_ms = 200 if bag_frame_count else 2000
+                        ok, _frames = _pipeline.try_wait_for_frames(timeout_ms)
+                        if ok:
+                            misses = 0
                             if _frames.get_color_frame():
                                 bag_frame_count += 1
-                        except RuntimeError:
-                            # End of file reached
+                            continue
+                        if _playback.current_status() == rs.playback_status.stopped:
+                            break
+                        misses += 1
+                        if not bag_frame_count or misses >= 3:
                             break
 
                     try:
@@ -1248,7 +1707,11 @@ def get_frame_comparison(batch_id: str):
                     cam_result["bag_frames"] = bag_frame_count
                     cam_result["bag_frames_source"] = "exact"
                 except Exception as e:
-                    print(f"[FrameComparison] BAG playback failed for {bag_path.name}: {e}")
+                    print(f"[FrameComparison] BAG playback failed for {bag_name}: {e}")
+                    try:
+                        _pipeline.stop()  # leave the shared pipeline reusable
+                    except Exception:
+                        pass
                     cam_result["bag_frames"] = None
                     cam_result["bag_frames_source"] = "unavailable"
             else:
@@ -1380,6 +1843,33 @@ def get_frame_comparison(batch_id: str):
     }
 
 
+def _file_response(directory, filename: str, media_type: str, headers: dict = None,
+                   not_found: str = "File not found"):
+    """
+    FileResponse for directory/filename, or a 404 JSONResponse.
+
+    Stats the file exactly once and hands the result to Starlette
+    (``stat_result=``) so it doesn't stat again. The body is streamed in
+    chunks read by Starlette on a worker thread — uvicorn supports neither
+    sendfile nor ``http.response.pathsend``, so this is not zero-copy. For
+    that, serve downloads from nginx (see ACCEL_REDIRECT_PREFIX).
+    """
+    path = os.path.join(str(directory), filename)
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        return JSONResponse(status_code=404, content={"error": not_found})
+    return FileResponse(
+        path,
+        media_type=media_type,
+        filename=filename,
+        stat_result=st,
+        headers=headers,
+    )
+
+
 @app.get("/videos/{video_name}")
 def get_video(video_name: str, request: Request):
     """
@@ -1388,40 +1878,110 @@ def get_video(video_name: str, request: Request):
     Uses Starlette's FileResponse which handles:
         - Accept-Ranges headers automatically
         - Byte-range requests for seeking
-        - Kernel-level sendfile() for efficient I/O
-        - No Python thread blocking during transfer
-    """
-    video_path = RECORDINGS_DIR / video_name
+        - Chunked async streaming (file reads run off the event loop)
 
-    if not video_path.exists():
-        return JSONResponse(status_code=404, content={"error": "Video not found"})
+    Under uvicorn the body is read and sent through Python, not sendfile;
+    the zero-copy path is nginx via ACCEL_REDIRECT_PREFIX (downloads only).
 
+    Range support lives in Starlette >= 0.39; requirements/base.txt pins a
+    FastAPI that guarantees it (older Starlette ignores Range and sends 200).
+    """
     media_type = "video/mp4" if video_name.endswith('.mp4') else "application/octet-stream"
 
     # FileResponse handles range requests, Accept-Ranges, and Content-Length
     # automatically via Starlette internals. Much more efficient than our
     # custom chunk_generator + StreamingResponse approach.
-    return FileResponse(
-        path=str(video_path),
-        media_type=media_type,
-        filename=video_name,
+    # "no-cache" makes the browser revalidate every range against the
+    # ETag/Last-Modified FileResponse sends (cheap 304s while scrubbing), so
+    # ranges of a file rewritten in place (re-encode, re-conversion) are never
+    # mixed with the old one; "private" because these are patient recordings.
+    return _file_response(
+        RECORDINGS_DIR, video_name, media_type,
+        headers={"Cache-Control": "private, no-cache"},
+        not_found="Video not found",
     )
 
 
+def _probe_embedded_tags(video_path: str, mtime_ns: int, size: int):
+    """
+    Read container tags via ffprobe.
+
+    Successful reads are cached on (path, mtime_ns, size) so repeated
+    requests for an unchanged file don't re-spawn ffprobe; failures (timeout,
+    ffprobe error) are not, so the next request retries. Returns a dict of
+    metadata fields or None.
+    """
+    if not FFPROBE_PATH:
+        return None
+    try:
+        return _probe_embedded_tags_cached(video_path, mtime_ns, size)
+    except Exception as e:
+        print(f"[Metadata] Error reading embedded tags: {e}")
+        return None
+
+
+@lru_cache(maxsize=512)
+def _probe_embedded_tags_cached(video_path: str, mtime_ns: int, size: int) -> dict:
+    """Cached body of _probe_embedded_tags; raises on failure (exceptions aren't cached)."""
+    result = subprocess.run([
+        FFPROBE_PATH, '-v', 'quiet', '-print_format', 'json',
+        # Only the tags we read — skips serialising the rest of the format block
+        '-show_entries', 'format_tags=artist,title,comment', video_path
+    ], capture_output=True, text=True, timeout=10)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe exited with code {result.returncode}")
+
+    data = json.loads(result.stdout)
+    tags = data.get('format', {}).get('tags', {})
+    return {
+        "patient_id": tags.get('artist', '') or tags.get('title', ''),
+        "comment": tags.get('comment', ''),
+        "source": "embedded"
+    }
+
+
+@lru_cache(maxsize=512)
+def _probe_container_fps(video_path: str, mtime_ns: int, size: int) -> float:
+    """Read FPS from the container (MP4 moov atom, then OpenCV). Cached on (path, mtime_ns, size)."""
+    if video_path.endswith('.mp4'):
+        mp4_info = read_mp4_video_info(video_path)
+        if mp4_info is not None and mp4_info["fps"] > 0:
+            return mp4_info["fps"]
+
+    try:
+        cap = cv2.VideoCapture(video_path)
+        if cap.isOpened():
+            cap_fps = cap.get(cv2.CAP_PROP_FPS)
+            cap.release()
+            if cap_fps > 0:
+                return cap_fps
+    except Exception:
+        pass
+    return 0.0
+
+
 @app.get("/videos/{video_name}/metadata")
-def get_video_metadata(video_name: str):
+async def get_video_metadata(video_name: str):
     """
     Read video metadata from sidecar JSON or embedded ffprobe tags.
     Fallback logic for FPS: Metadata -> Container (MP4/BAG) -> Default.
     """
+    return await _run_blocking(_video_metadata, video_name)
+
+
+def _video_metadata(video_name: str):
+    """Blocking body of get_video_metadata (stat, sidecar read, ffprobe)."""
     video_path = RECORDINGS_DIR / video_name
 
-    if not video_path.exists():
+    try:
+        video_stat = video_path.stat()
+    except OSError:
         return JSONResponse(status_code=404, content={"error": "Video not found"})
+    probe_key = (str(video_path), video_stat.st_mtime_ns, video_stat.st_size)
 
     # Try sidecar JSON first
     metadata_file = video_name.replace('.mp4', '_metadata.json')
-    metadata_path = RECORDINGS_DIR / metadata_file
+    data = _load_sidecar(RECORDINGS_DIR / metadata_file)
 
     result_metadata = {
         "patient_id": "",
@@ -1433,9 +1993,8 @@ def get_video_metadata(video_name: str):
     }
 
     # 1. Try Sidecar
-    if metadata_path.exists():
+    if data:
         try:
-            data = json.loads(metadata_path.read_text())
             result_metadata.update({
                 "patient_id": data.get('patient_id', ''),
                 "comment": f"Patient ID: {data.get('patient_id', '')}",
@@ -1449,39 +2008,13 @@ def get_video_metadata(video_name: str):
 
     # 2. Fallback to FFprobe if no sidecar data found
     if result_metadata["source"] == "none":
-        try:
-            import os
-            ffmpeg_path = imageio_ffmpeg.get_ffmpeg_exe()
-            ffmpeg_dir = os.path.dirname(ffmpeg_path)
-            ffprobe_path = os.path.join(ffmpeg_dir, 'ffprobe.exe' if os.name == 'nt' else 'ffprobe')
-
-            if os.path.exists(ffprobe_path):
-                result = subprocess.run([
-                    ffprobe_path, '-v', 'quiet', '-print_format', 'json', '-show_format', str(video_path)
-                ], capture_output=True, text=True, timeout=10)
-
-                if result.returncode == 0:
-                    data = json.loads(result.stdout)
-                    tags = data.get('format', {}).get('tags', {})
-                    result_metadata.update({
-                        "patient_id": tags.get('artist', '') or tags.get('title', ''),
-                        "comment": tags.get('comment', ''),
-                        "source": "embedded"
-                    })
-        except Exception as e:
-            print(f"[Metadata] Error reading embedded tags: {e}")
+        tags = _probe_embedded_tags(*probe_key)
+        if tags:
+            result_metadata.update(tags)
 
-    # 3. FPS Fallback: If missing/invalid, try reading from container via OpenCV
+    # 3. FPS Fallback: If missing/invalid, read from the container (moov atom, then OpenCV)
     if result_metadata["fps"] <= 0:
-        try:
-            cap = cv2.VideoCapture(str(video_path))
-            if cap.isOpened():
-                cap_fps = cap.get(cv2.CAP_PROP_FPS)
-                if cap_fps > 0:
-                    result_metadata["fps"] = cap_fps
-                cap.release()
-        except Exception:
-            pass
+        result_metadata["fps"] = _probe_container_fps(*probe_key)
 
     # 4. Final FPS Default
     if result_metadata["fps"] <= 0:
@@ -1509,16 +2042,9 @@ def save_tagging(data: SaveTaggingRequest):
     video_name = video_name.replace('camera1', 'CF').replace('camera2', 'CS')
 
     # Fetch metadata to enrich filename
-    metadata_path = RECORDINGS_DIR / f"{data.videoFile.replace('.mp4', '')}_metadata.json"
-    patient_id = ""
-    note = ""
-    if metadata_path.exists():
-        try:
-            meta = json.loads(metadata_path.read_text())
-            patient_id = meta.get("patient_id", "")
-            note = meta.get("note", "")
-        except Exception:
-            pass
+    meta = _load_sidecar(RECORDINGS_DIR / f"{data.videoFile.replace('.mp4', '')}_metadata.json")
+    patient_id = meta.get("patient_id", "") if meta else ""
+    note = meta.get("note", "") if meta else ""
 
     # Construct standardized filename:
     # {batch_id}_{CF|CS}_{patient_id}_{note}_tagging.csv
@@ -1549,15 +2075,14 @@ def save_tagging(data: SaveTaggingRequest):
     
     filename = "_".join(parts_out) + ".csv"
     filepath = TAGGING_DIR / filename
-    filepath = TAGGING_DIR / filename
-
-    headers = ['Frame', 'Direction', 'Direction_Human']
-    rows = [headers]
-    for log in data.logs:
-        rows.append([str(log.frame), str(log.direction), log.action])
 
-    csv_content = '\n'.join([','.join(row) for row in rows])
-    filepath.write_text(csv_content)
+    # csv.writer streams rows to disk and quotes fields containing commas;
+    # a 64 KiB buffer turns thousands of small row writes into a few syscalls
+    with filepath.open('w', newline='', encoding='utf-8', buffering=1 << 16) as fp:
+        writer = csv.writer(fp, lineterminator='\n')
+        writer.writerow(['Frame', 'Direction', 'Direction_Human'])
+        writer.writerows((log.frame, log.direction, log.action) for log in data.logs)
+    _invalidate_listing_caches()
 
     return {
         "success": True,
@@ -1568,47 +2093,147 @@ def save_tagging(data: SaveTaggingRequest):
 
 
 # =============================================================================
-#                          PROCESSING ROUTES
+#                          BACKGROUND JOB POOLS
 # =============================================================================
 
-@app.post("/recordings/fix-mp4-codec")
-def fix_mp4_codec():
-    """Re-encode MP4 files to browser-compatible H.264."""
-    if not FFMPEG_AVAILABLE:
-        return {"success": False, "message": "ffmpeg not available", "fixed": []}
+# Bounded pools so concurrent processing/conversion requests queue up instead
+# of each spawning threads that fight over CPU, GPU and disk.
+# Processing submits one task per camera; conversion one task per batch
+# (convert_bag_to_mp4 runs both cameras itself).
+# Processing is sized from the CPU count (decode + pose post-processing are
+# CPU work; at least 2 so both cameras of a batch run side by side).
+PROCESS_POOL = ThreadPoolExecutor(
+    max_workers=max(2, (os.cpu_count() or 2) // 2), thread_name_prefix="process"
+)
+CONVERT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="convert")
 
-    fixed = []
-    errors = []
 
-    for mp4_file in RECORDINGS_DIR.glob("*.mp4"):
-        temp_file = mp4_file.with_suffix('.mp4.tmp')
+# job_id -> futures. Kept out of the job dicts, which are returned as JSON.
+_job_futures: Dict[str, list] = {}
 
-        try:
-            ffmpeg_path = imageio_ffmpeg.get_ffmpeg_exe()
-            print(f"[FixCodec] Re-encoding {mp4_file.name}...")
+
+@app.on_event("shutdown")
+def shutdown_job_pools():
+    """
+    Stop background jobs and the pools on server shutdown.
+
+    Pool workers are non-daemon threads that the interpreter joins at exit,
+    so running jobs are told to stop through their cancel flags (polled per
+    batch / chunk) and queued ones are cancelled. Futures are cancelled by
+    hand: shutdown(cancel_futures=True) needs Python 3.9 (Jetson runs 3.8).
+    """
+    for job_id in list(_job_futures):
+        cancel_job(job_id)
+        cancel_conversion_job(job_id)
+        _cancel_job_futures(job_id)
+    for pool in (PROCESS_POOL, CONVERT_POOL, _SIDECAR_POOL, _STAT_POOL):
+        pool.shutdown(wait=False)
+
+
+def _track_job_futures(job_id: str, futures: list):
+    """Remember a job's futures until they have all finished."""
+    _job_futures[job_id] = futures
+
+    def _prune(_future):
+        if all(f.done() for f in futures):
+            _job_futures.pop(job_id, None)
+            # Jobs write results / MP4s and rewrite sidecars
+            _invalidate_listing_caches()
+
+    for future in futures:
+        future.add_done_callback(_prune)
+
+
+def _cancel_job_futures(job_id: str):
+    """Drop a job's tasks that are still queued (running ones poll the cancel flag)."""
+    for future in _job_futures.pop(job_id, ()):
+        future.cancel()
+
+
+# =============================================================================
+#                          PROCESSING ROUTES
+# =============================================================================
+
+def _reencode_mp4(mp4_file, encoder, threads: int = 2):
+    """
+    Re-encode one MP4 to browser-compatible H.264 in place.
+
+    Tries ``encoder`` first and falls back to libx264 if it fails.
+    ``threads`` caps ffmpeg's own thread count (several files run at once).
+    Returns None on success, or an error string.
+    """
+    temp_file = mp4_file.with_suffix('.mp4.tmp')
+    encoders = [encoder] if encoder == "libx264" else [encoder, "libx264"]
+    stderr = "No error output"
+
+    try:
+        for enc in encoders:
+            print(f"[FixCodec] Re-encoding {mp4_file.name} ({enc})...")
 
             result = subprocess.run([
-                ffmpeg_path, '-y', '-i', str(mp4_file),
-                '-c:v', 'libx264', '-preset', 'fast', '-crf', '23',
+                FFMPEG_PATH, '-y', '-i', str(mp4_file),
+                *H264_ENCODER_ARGS[enc],
+                '-threads', str(threads),
                 '-pix_fmt', 'yuv420p', '-movflags', '+faststart',
                 str(temp_file)
             ], capture_output=True, timeout=300)
 
-            if temp_file.exists() and temp_file.stat().st_size > 0:
+            if result.returncode == 0 and temp_file.exists() and temp_file.stat().st_size > 0:
                 mp4_file.unlink()
                 temp_file.rename(mp4_file)
-                fixed.append(mp4_file.name)
                 print(f"[FixCodec] Fixed {mp4_file.name}")
-            else:
-                stderr = result.stderr.decode() if result.stderr else "No error output"
-                errors.append(f"{mp4_file.name}: {stderr[:200]}")
-                if temp_file.exists():
-                    temp_file.unlink()
-        except Exception as e:
-            errors.append(f"{mp4_file.name}: {str(e)}")
+                return None
+
+            stderr = result.stderr.decode() if result.stderr else "No error output"
             if temp_file.exists():
                 temp_file.unlink()
 
+        return f"{mp4_file.name}: {stderr[:200]}"
+    except Exception as e:
+        if temp_file.exists():
+            temp_file.unlink()
+        return f"{mp4_file.name}: {str(e)}"
+
+
+@app.post("/recordings/fix-mp4-codec")
+def fix_mp4_codec():
+    """
+    Re-encode MP4 files to browser-compatible H.264 (a few files in parallel).
+
+    Uses a hardware encoder when the FFmpeg build has one (see
+    :func:`writers.detect_hw_encoder`), falling back to libx264 per file.
+    """
+    if not FFMPEG_AVAILABLE or not FFMPEG_PATH:
+        return {"success": False, "message": "ffmpeg not available", "fixed": []}
+
+    fixed = []
+    errors = []
+
+    encoder = detect_hw_encoder()
+    mp4_files = list(RECORDINGS_DIR.glob("*.mp4"))
+    if not mp4_files:
+        return {"success": True, "message": "Fixed 0 files", "fixed": [], "errors": []}
+
+    # Split the cores between concurrent ffmpeg processes so
+    # workers x threads never oversubscribes the CPU
+    cpu_count = os.cpu_count() or 2
+    max_workers = max(1, min(4, cpu_count // 2, len(mp4_files)))
+    threads_per_file = max(1, cpu_count // max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_reencode_mp4, f, encoder, threads_per_file): f
+            for f in mp4_files
+        }
+        for future in as_completed(futures):
+            error = future.result()
+            if error is None:
+                fixed.append(futures[future].name)
+            else:
+                errors.append(error)
+
+    if fixed:
+        _invalidate_listing_caches()
     return {
         "success": len(errors) == 0,
         "message": f"Fixed {len(fixed)} files",
@@ -1617,23 +2242,28 @@ def fix_mp4_codec():
     }
 
 
+def _batch_cameras_present(snap: RecordingsSnapshot, batch_id: str, exts: tuple) -> Tuple[bool, bool]:
+    """
+    Check which cameras of a batch have a file with one of ``exts``.
+
+    Matches old naming ({batch}_camera1.bag) and new naming ({batch}_CF_*.bag)
+    against the snapshot, so no glob/exists syscalls.
+    """
+    present = []
+    for legacy, label in (("camera1", "CF"), ("camera2", "CS")):
+        present.append(any(
+            snap.has(f"{batch_id}_{legacy}.{ext}") or snap.find(f"{batch_id}_{label}", ext)
+            for ext in exts
+        ))
+    return present[0], present[1]
+
+
 @app.post("/processing/start")
-def start_processing(data: ProcessRequest):
+def start_processing(data: ProcessRequest, snap: RecordingsSnapshot = Depends(recordings_snapshot)):
     """Start processing a video batch."""
     batch_id = data.batch_id
 
-    camera1_bag = RECORDINGS_DIR / f"{batch_id}_camera1.bag"
-    camera2_bag = RECORDINGS_DIR / f"{batch_id}_camera2.bag"
-    camera1_mp4 = RECORDINGS_DIR / f"{batch_id}_camera1.mp4"
-    camera2_mp4 = RECORDINGS_DIR / f"{batch_id}_camera2.mp4"
-
-    has_cam1 = camera1_bag.exists() or camera1_mp4.exists()
-    has_cam2 = camera2_bag.exists() or camera2_mp4.exists()
-
-    if not has_cam1:
-        has_cam1 = bool(list(RECORDINGS_DIR.glob(f"{batch_id}_CF*.bag")) or list(RECORDINGS_DIR.glob(f"{batch_id}_CF*.mp4")))
-    if not has_cam2:
-        has_cam2 = bool(list(RECORDINGS_DIR.glob(f"{batch_id}_CS*.bag")) or list(RECORDINGS_DIR.glob(f"{batch_id}_CS*.mp4")))
+    has_cam1, has_cam2 = _batch_cameras_present(snap, batch_id, ("bag", "mp4"))
 
     if not has_cam1 and not has_cam2:
         return {"success": False, "message": "No camera files found"}
@@ -1649,12 +2279,12 @@ def start_processing(data: ProcessRequest):
     job_id = create_processing_job(batch_id, has_cam1, has_cam2)
     is_orphan = (has_cam1 or has_cam2) and not (has_cam1 and has_cam2)
 
+    futures = []
     if has_cam1:
-        t1 = threading.Thread(target=process_video, args=(job_id, 1, batch_id))
-        t1.start()
+        futures.append(PROCESS_POOL.submit(process_video, job_id, 1, batch_id))
     if has_cam2:
-        t2 = threading.Thread(target=process_video, args=(job_id, 2, batch_id))
-        t2.start()
+        futures.append(PROCESS_POOL.submit(process_video, job_id, 2, batch_id))
+    _track_job_futures(job_id, futures)
 
     return {
         "success": True,
@@ -1677,6 +2307,7 @@ def get_processing_status(job_id: str):
 def cancel_processing(job_id: str):
     """Cancel a processing job."""
     if cancel_job(job_id):
+        _cancel_job_futures(job_id)
         return {"success": True, "message": "Processing cancelled"}
     return {"success": False, "message": "Job not found"}
 
@@ -1692,7 +2323,7 @@ def list_processing_jobs():
 # =============================================================================
 
 @app.post("/conversion/start")
-def start_conversion(data: ConversionStartRequest):
+def start_conversion(data: ConversionStartRequest, snap: RecordingsSnapshot = Depends(recordings_snapshot)):
     """
     Start BAG→MP4 conversion for a batch.
 
@@ -1705,19 +2336,7 @@ def start_conversion(data: ConversionStartRequest):
     batch_id = data.batch_id
 
     # Check both old naming (_camera1/_camera2) and new naming (_CF/_CS)
-    camera1_bag = RECORDINGS_DIR / f"{batch_id}_camera1.bag"
-    camera2_bag = RECORDINGS_DIR / f"{batch_id}_camera2.bag"
-    has_cam1 = camera1_bag.exists()
-    has_cam2 = camera2_bag.exists()
-
-    if not has_cam1:
-        candidates = list(RECORDINGS_DIR.glob(f"{batch_id}_CF*.bag"))
-        if candidates:
-            has_cam1 = True
-    if not has_cam2:
-        candidates = list(RECORDINGS_DIR.glob(f"{batch_id}_CS*.bag"))
-        if candidates:
-            has_cam2 = True
+    has_cam1, has_cam2 = _batch_cameras_present(snap, batch_id, ("bag",))
 
     if not has_cam1 and not has_cam2:
         return {"success": False, "message": "No BAG files found for this batch"}
@@ -1733,12 +2352,8 @@ def start_conversion(data: ConversionStartRequest):
     job_id = create_conversion_job(batch_id, has_cam1, has_cam2, force=data.force)
     is_orphan = (has_cam1 or has_cam2) and not (has_cam1 and has_cam2)
 
-    t = threading.Thread(
-        target=convert_bag_to_mp4,
-        args=(job_id, batch_id, has_cam1, has_cam2),
-        daemon=True,
-    )
-    t.start()
+    future = CONVERT_POOL.submit(convert_bag_to_mp4, job_id, batch_id, has_cam1, has_cam2)
+    _track_job_futures(job_id, [future])
 
     return {
         "success": True,
@@ -1761,6 +2376,7 @@ def get_conversion_status(job_id: str):
 def cancel_conversion(job_id: str):
     """Cancel a conversion job."""
     if cancel_conversion_job(job_id):
+        _cancel_job_futures(job_id)
         return {"success": True, "message": "Conversion cancelled"}
     return {"success": False, "message": "Job not found"}
 
@@ -1775,13 +2391,57 @@ def list_conversion_jobs():
 #                        FILE MANAGEMENT ROUTES
 # =============================================================================
 
+
+
 @app.get("/files/all")
-def list_all_files():
+async def list_all_files():
     """
     List all files organized by type.
 
     Videos grouped by batch showing BAG (high-quality) + MP4 preview info.
+    Cached until one of the directories changes (or 5s pass).
     """
+    return await _files_listing_cache.aget(_scan_file_listing)
+
+
+async def _scan_file_listing() -> dict:
+    """Scan the three directories concurrently, then build the listing off the event loop."""
+    snap, tagging_files, processed_files = await asyncio.gather(
+        _run_blocking(RecordingsSnapshot, RECORDINGS_DIR),
+        _run_blocking(_scan_dir, TAGGING_DIR),
+        _run_blocking(_scan_dir, PROCESSED_DIR),
+    )
+    return await _run_blocking(_build_file_listing, snap, tagging_files, processed_files)
+
+
+def _new_batch(batch_id: str) -> dict:
+    """Fresh /files/all batch entry with every field present (one dict literal)."""
+    return {
+        "batch_id": batch_id,
+        "camera1": None,
+        "camera2": None,
+        "camera1_size": 0,
+        "camera2_size": 0,
+        "camera1_hq_size": 0,
+        "camera2_hq_size": 0,
+        "camera1_mp4_size": 0,
+        "camera2_mp4_size": 0,
+        "camera1_has_mp4": False,
+        "camera2_has_mp4": False,
+        "camera1_bag_name": None,
+        "camera2_bag_name": None,
+        "camera1_type": None,
+        "camera2_type": None,
+        "patient_id": "",
+        "recorded_at": "",
+        "note": "",
+        "modified": 0,
+        "_mtime_ns": 0,
+    }
+
+
+def _build_file_listing(snap: "RecordingsSnapshot", tagging_files: dict, processed_files: dict) -> dict:
+    """Build the /files/all response from directory scans."""
     result = {
         "videos": [],
         "csvs": [],
@@ -1791,141 +2451,75 @@ def list_all_files():
     batches: Dict[str, dict] = {}
 
     # Process BAG files (RealSense recordings)
-    for f in RECORDINGS_DIR.glob("*.bag"):
-        name = f.stem
-        # Try both formats:
-        # Old: YYYY-MM-DD_HH-MM-SS_camera1.bag
-        # New: YYYY-MM-DD_HH-MM-SS_CF_note.bag
-        
-        parts_old = name.rsplit('_camera', 1)
-        
-        batch_id = ""
-        camera_num = ""
-        
-        if len(parts_old) == 2:
-             batch_id = parts_old[0]
-             camera_num = parts_old[1] # "1" or "2"
-        else:
-             # Try new format
-             if "_CF" in name:
-                 parts_new = name.split('_CF')
-                 batch_id = parts_new[0]
-                 camera_num = "1"
-             elif "_CS" in name:
-                 parts_new = name.split('_CS')
-                 batch_id = parts_new[0]
-                 camera_num = "2"
-        
-        if batch_id and camera_num:
-            if batch_id not in batches:
-                batches[batch_id] = {
-                    "batch_id": batch_id,
-                    "camera1": None,
-                    "camera2": None,
-                    "camera1_size": 0,
-                    "camera2_size": 0,
-                    "camera1_hq_size": 0,
-                    "camera2_hq_size": 0,
-                    "camera1_mp4_size": 0,
-                    "camera2_mp4_size": 0,
-                    "camera1_has_mp4": False,
-                    "camera2_has_mp4": False,
-                    "camera1_bag_name": None,
-                    "camera2_bag_name": None,
-                    "camera1_type": None,
-                    "camera2_type": None,
-                    "modified": None
-                }
-
-            hq_size = f.stat().st_size
-            mtime = datetime.fromtimestamp(f.stat().st_mtime).isoformat()
-
-            mp4_path = RECORDINGS_DIR / f"{name}.mp4"
-            mp4_exists = mp4_path.exists()
-            mp4_size = mp4_path.stat().st_size if mp4_exists else 0
-
-            file_info = {
-                "name": mp4_path.name if mp4_exists else f.name,
-                "size": hq_size + mp4_size
-            }
-
-            if camera_num == "1":
-                batches[batch_id]["camera1"] = file_info
-                batches[batch_id]["camera1_size"] = hq_size + mp4_size
-                batches[batch_id]["camera1_hq_size"] = hq_size
-                batches[batch_id]["camera1_mp4_size"] = mp4_size
-                batches[batch_id]["camera1_has_mp4"] = mp4_exists
-                batches[batch_id]["camera1_bag_name"] = f.name
-                batches[batch_id]["camera1_type"] = CAMERA_TYPE_REALSENSE
-            elif camera_num == "2":
-                batches[batch_id]["camera2"] = file_info
-                batches[batch_id]["camera2_size"] = hq_size + mp4_size
-                batches[batch_id]["camera2_hq_size"] = hq_size
-                batches[batch_id]["camera2_mp4_size"] = mp4_size
-                batches[batch_id]["camera2_has_mp4"] = mp4_exists
-                batches[batch_id]["camera2_bag_name"] = f.name
-                batches[batch_id]["camera2_type"] = CAMERA_TYPE_REALSENSE
-
-            if batches[batch_id]["modified"] is None or mtime > batches[batch_id]["modified"]:
-                batches[batch_id]["modified"] = mtime
+    for bag_name in snap.by_ext["bag"]:
+        name = bag_name[:-4]
+        parsed = _parse_batch_name(name)
+        if not parsed:
+            continue
+        batch_id, camera_num = parsed
+        batch = batches.get(batch_id)
+        if batch is None:
+            batch = batches[batch_id] = _new_batch(batch_id)
+
+        bag_stat = snap.stat_by_name[bag_name]
+        hq_size = bag_stat.st_size
+
+        mp4_name = f"{name}.mp4"
+        mp4_exists = snap.has(mp4_name)
+        mp4_size = snap.stat_by_name[mp4_name].st_size if mp4_exists else 0
+
+        cam = f"camera{camera_num}"
+        batch[cam] = {"name": mp4_name if mp4_exists else bag_name, "size": hq_size + mp4_size}
+        batch[f"{cam}_size"] = hq_size + mp4_size
+        batch[f"{cam}_hq_size"] = hq_size
+        batch[f"{cam}_mp4_size"] = mp4_size
+        batch[f"{cam}_has_mp4"] = mp4_exists
+        batch[f"{cam}_bag_name"] = bag_name
+        batch[f"{cam}_type"] = CAMERA_TYPE_REALSENSE
+
+        if bag_stat.st_mtime_ns > batch["_mtime_ns"]:
+            batch["_mtime_ns"] = bag_stat.st_mtime_ns
 
     # Enrich each batch with patient metadata from sidecar JSON
+    meta_jobs = []
     for batch_id, batch in batches.items():
-        meta_path = None
-        
-        # Try to find metadata from actual bag filenames
-        if batch.get("camera1_bag_name"):
-             bag_name = batch["camera1_bag_name"]
-             base_name = os.path.splitext(bag_name)[0]
-             possible_meta = RECORDINGS_DIR / f"{base_name}_metadata.json"
-             if possible_meta.exists():
-                 meta_path = possible_meta
-        
-        if not meta_path and batch.get("camera2_bag_name"):
-             bag_name = batch["camera2_bag_name"]
-             base_name = os.path.splitext(bag_name)[0]
-             possible_meta = RECORDINGS_DIR / f"{base_name}_metadata.json"
-             if possible_meta.exists():
-                 meta_path = possible_meta
+        meta_name = None
+        for bag_name in (batch["camera1_bag_name"], batch["camera2_bag_name"]):
+            if bag_name:
+                meta_name = snap.json_by_stem.get(bag_name[:-4])
+                if meta_name:
+                    break
 
         # Fallback to legacy naming (only if no valid path found above)
-        if not meta_path or not meta_path.exists():
-             meta_path = RECORDINGS_DIR / f"{batch_id}_camera1_metadata.json"
-             if not meta_path.exists():
-                 meta_path = RECORDINGS_DIR / f"{batch_id}_camera2_metadata.json"
+        if not meta_name:
+            meta_name = (snap.json_by_stem.get(f"{batch_id}_camera1")
+                         or snap.json_by_stem.get(f"{batch_id}_camera2"))
 
-        batch["patient_id"] = ""
-        batch["recorded_at"] = ""
-        batch["note"] = ""
+        if meta_name:
+            meta_jobs.append((batch, snap.path_str(meta_name), snap.stat_by_name[meta_name].st_mtime_ns))
 
-        if meta_path.exists():
-            try:
-                meta = json.loads(meta_path.read_text())
-                batch["patient_id"] = meta.get("patient_id", "")
-                batch["recorded_at"] = meta.get("recorded_at", "")
-                batch["note"] = meta.get("note", "")
-            except Exception:
-                pass
+    # Sidecar reads are small blocking I/O — overlap them on the pool
+    # (cache hits return immediately; only misses touch the disk)
+    for (batch, _, _), meta in zip(meta_jobs, _SIDECAR_POOL.map(_read_sidecar_job, meta_jobs)):
+        batch["patient_id"] = meta.get("patient_id", "")
+        batch["recorded_at"] = meta.get("recorded_at", "")
+        batch["note"] = meta.get("note", "")
 
-    result["videos"] = sorted(batches.values(), key=lambda x: x["modified"] or "", reverse=True)
+    result["videos"] = sorted(batches.values(), key=itemgetter("_mtime_ns"), reverse=True)
+    for batch in result["videos"]:
+        batch["modified"] = batch.pop("_mtime_ns") // 1_000_000_000
 
     # CSVs
-    for f in TAGGING_DIR.glob("*.csv"):
-        result["csvs"].append({
-            "name": f.name,
-            "size": f.stat().st_size,
-            "modified": datetime.fromtimestamp(f.stat().st_mtime).isoformat()
-        })
-    result["csvs"].sort(key=lambda x: x["modified"], reverse=True)
+    for name, st in tagging_files.items():
+        if name.endswith(".csv"):
+            result["csvs"].append({"name": name, "size": st.st_size, "modified": int(st.st_mtime)})
+    result["csvs"].sort(key=itemgetter("modified"), reverse=True)
 
     # JSONs
-    for f in PROCESSED_DIR.glob("*.json"):
-        result["jsons"].append({
-            "name": f.name,
-            "size": f.stat().st_size,
-            "modified": datetime.fromtimestamp(f.stat().st_mtime).isoformat()
-        })
-    result["jsons"].sort(key=lambda x: x["modified"], reverse=True)
+    for name, st in processed_files.items():
+        if name.endswith(".json"):
+            result["jsons"].append({"name": name, "size": st.st_size, "modified": int(st.st_mtime)})
+    result["jsons"].sort(key=itemgetter("modified"), reverse=True)
     
     # Enrich CSVs and JSONs with metadata parsed from filename or sidecars
     # This is done on the fly since these are just file lists
@@ -1946,31 +2540,25 @@ def delete_single_video(filename: str):
     deleted = []
     errors = []
 
-    if filename.endswith('.mp4'):
-        base_name = filename[:-4]
-    elif filename.endswith('.bag'):
-        base_name = filename[:-4]
-    else:
+    if filename[-4:] not in ('.mp4', '.bag'):
         return {"success": False, "message": f"Invalid file type: {filename}"}
+    base_name = filename[:-4]
 
-    files_to_delete = [
-        f"{base_name}.bag",
-        f"{base_name}.mp4",
-        f"{base_name}_metadata.json"
-    ]
-
-    for file in files_to_delete:
-        filepath = RECORDINGS_DIR / file
-        if filepath.exists():
-            try:
-                filepath.unlink()
-                deleted.append(file)
-                print(f"[Delete] Removed: {file}")
-            except Exception as e:
-                errors.append(f"{file}: {str(e)}")
+    # unlink directly (EAFP) — one syscall per file instead of exists() + unlink()
+    for suffix in ('.bag', '.mp4', '_metadata.json'):
+        file = base_name + suffix
+        try:
+            os.unlink(os.path.join(str(RECORDINGS_DIR), file))
+            deleted.append(file)
+            print(f"[Delete] Removed: {file}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            errors.append(f"{file}: {str(e)}")
 
     if not deleted:
         return {"success": False, "message": f"No files found for: {base_name}"}
+    _invalidate_listing_caches()
 
     if errors:
         return {"success": False, "deleted": deleted, "errors": errors}
@@ -1983,29 +2571,33 @@ def delete_video_batch(batch_id: str):
     deleted = []
     errors = []
 
-    # Old naming: {batch_id}_camera1.bag, {batch_id}_camera2.bag
-    for cam_num in [1, 2]:
-        base_name = f"{batch_id}_camera{cam_num}"
-
-        for ext in ['.bag', '.mp4', '_metadata.json']:
-            filename = base_name + ext
-            filepath = RECORDINGS_DIR / filename
-            if filepath.exists():
-                try:
-                    filepath.unlink()
-                    deleted.append(filename)
-                except Exception as e:
-                    errors.append(f"{filename}: {str(e)}")
+    # Old naming: {batch_id}_camera1.bag, {batch_id}_camera2.bag (exact names)
+    legacy_names = {
+        f"{batch_id}_camera{cam_num}{ext}"
+        for cam_num in (1, 2)
+        for ext in ('.bag', '.mp4', '_metadata.json')
+    }
+    # New naming: {batch_id}_CF*, {batch_id}_CS* (BAG, MP4, metadata, temp files)
+    new_prefixes = (f"{batch_id}_CF", f"{batch_id}_CS")
+
+    # One scandir pass instead of per-name exists() probes plus two globs
+    with os.scandir(RECORDINGS_DIR) as it:
+        to_delete = [
+            entry for entry in it
+            if entry.name in legacy_names or entry.name.startswith(new_prefixes)
+        ]
 
-    # New naming: {batch_id}_CF*.bag, {batch_id}_CS*.bag (and matching .mp4, _metadata.json)
-    for suffix in ["CF", "CS"]:
-        for f in RECORDINGS_DIR.glob(f"{batch_id}_{suffix}*"):
-            try:
-                f.unlink()
-                deleted.append(f.name)
-            except Exception as e:
-                errors.append(f"{f.name}: {str(e)}")
+    for entry in to_delete:
+        try:
+            os.unlink(entry.path)
+            deleted.append(entry.name)
+        except FileNotFoundError:
+            pass  # removed concurrently since the scan — nothing left to delete
+        except Exception as e:
+            errors.append(f"{entry.name}: {str(e)}")
 
+    if deleted:
+        _invalidate_listing_caches()
     if errors:
         return {"success": False, "deleted": deleted, "errors": errors}
     return {"success": True, "deleted": deleted, "message": f"Deleted batch {batch_id}"}
@@ -2014,83 +2606,113 @@ def delete_video_batch(batch_id: str):
 @app.delete("/files/csv/{filename}")
 def delete_csv(filename: str):
     """Delete a CSV file."""
-    filepath = TAGGING_DIR / filename
-    if not filepath.exists():
-        return {"success": False, "message": "File not found"}
+    # unlink directly (EAFP): ENOENT is the "not found" case, no exists() probe
     try:
-        filepath.unlink()
-        return {"success": True, "message": f"Deleted {filename}"}
+        os.unlink(os.path.join(str(TAGGING_DIR), filename))
+    except FileNotFoundError:
+        return {"success": False, "message": "File not found"}
     except Exception as e:
         return {"success": False, "message": str(e)}
+    _invalidate_listing_caches()
+    return {"success": True, "message": f"Deleted {filename}"}
 
 
 @app.delete("/files/json/{filename}")
 def delete_json(filename: str):
     """Delete a JSON file."""
-    filepath = PROCESSED_DIR / filename
-    if not filepath.exists():
-        return {"success": False, "message": "File not found"}
     try:
-        filepath.unlink()
-        return {"success": True, "message": f"Deleted {filename}"}
+        os.unlink(os.path.join(str(PROCESSED_DIR), filename))
+    except FileNotFoundError:
+        return {"success": False, "message": "File not found"}
     except Exception as e:
         return {"success": False, "message": str(e)}
+    _invalidate_listing_caches()
+    return {"success": True, "message": f"Deleted {filename}"}
 
 
 # -----------------------------------------------------------------------------
 #                        DOWNLOAD ENDPOINTS
 # -----------------------------------------------------------------------------
 
+def _recording_download(filename: str, media_type: str):
+    """
+    Download response for a file in RECORDINGS_DIR.
+
+    With ACCEL_REDIRECT_PREFIX set, only the headers are returned and nginx
+    serves the body from its internal location (multi-GB BAGs don't tie up
+    an API worker); otherwise the API sends the file itself.
+    """
+    if not ACCEL_REDIRECT_PREFIX:
+        return _file_response(RECORDINGS_DIR, filename, media_type)
+    try:
+        st = os.stat(os.path.join(str(RECORDINGS_DIR), filename))
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        return JSONResponse(status_code=404, content={"error": "File not found"})
+    return Response(
+        media_type=media_type,
+        headers={
+            "X-Accel-Redirect": ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(filename),
+            "Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}",
+        },
+    )
+
+
 @app.get("/files/download/video/{filename}")
 def download_video(filename: str):
     """Download a video file (MP4)."""
-    filepath = RECORDINGS_DIR / filename
-    if not filepath.exists():
-        return JSONResponse(status_code=404, content={"error": "File not found"})
-    return FileResponse(filepath, filename=filename, media_type="video/mp4")
+    return _recording_download(filename, "video/mp4")
 
 
 @app.get("/files/download/bag/{filename}")
 def download_bag(filename: str):
     """Download a RealSense BAG file."""
-    filepath = RECORDINGS_DIR / filename
-    if not filepath.exists():
-        return JSONResponse(status_code=404, content={"error": "File not found"})
-    return FileResponse(filepath, filename=filename, media_type="application/octet-stream")
+    return _recording_download(filename, "application/octet-stream")
 
 
 @app.get("/files/download/csv/{filename}")
 def download_csv(filename: str):
     """Download a CSV file."""
-    filepath = TAGGING_DIR / filename
-    if not filepath.exists():
-        return JSONResponse(status_code=404, content={"error": "File not found"})
-    return FileResponse(filepath, filename=filename, media_type="text/csv")
+    return _file_response(TAGGING_DIR, filename, "text/csv")
 
 
 @app.get("/files/download/json/{filename}")
 def download_json(filename: str):
     """Download a JSON file."""
-    filepath = PROCESSED_DIR / filename
-    if not filepath.exists():
-        return JSONResponse(status_code=404, content={"error": "File not found"})
-    return FileResponse(filepath, filename=filename, media_type="application/json")
+    return _file_response(PROCESSED_DIR, filename, "application/json")
 
 
 @app.get("/files/view/json/{filename}")
 def view_json(filename: str):
-    """View JSON file content."""
-    filepath = PROCESSED_DIR / filename
-    if not filepath.exists():
-        filepath = RECORDINGS_DIR / filename
-        if not filepath.exists():
-            return JSONResponse(status_code=404, content={"error": "File not found"})
+    """
+    View JSON file content.
+
+    The file's bytes are spliced into the response as-is instead of being
+    parsed into dicts and re-serialised (result files can be several MB).
+    They are still parsed once to validate, so a corrupt file keeps
+    returning {"error": ...} rather than a broken response body.
+    """
+    raw = None
+    for directory in (PROCESSED_DIR, RECORDINGS_DIR):
+        try:
+            with open(os.path.join(str(directory), filename), 'rb') as fp:
+                raw = fp.read()
+            break
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            return {"error": str(e)}
+    if raw is None:
+        return JSONResponse(status_code=404, content={"error": "File not found"})
 
     try:
-        content = json.loads(filepath.read_text())
-        return {"success": True, "filename": filename, "content": content}
+        _json_loads(raw)
     except Exception as e:
         return {"error": str(e)}
+    body = (b'{"success":true,"filename":' + json.dumps(filename).encode()
+            + b',"content":' + raw + b'}')
+    return Response(content=body, media_type="application/json")
 
 
 if __name__ == "__main__":
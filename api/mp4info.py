@@ -0,0 +1,172 @@
+"""
+MP4 Container Inspection
+========================
+
+Lightweight reader for the handful of MP4 atoms we need to answer
+"how many frames / what frame rate" without opening the file through
+OpenCV or FFmpeg.
+
+Only the ``moov`` box is read into memory (a few KB for our recordings —
+it sits at the head of the file thanks to ``-movflags +faststart``). The
+video track is located via its ``hdlr`` box and the frame count is summed
+from ``stts`` (decoding time-to-sample) entries::
+
+    moov / trak / mdia / hdlr            handler type ("vide")
+    moov / trak / mdia / mdhd            media timescale
+    moov / trak / mdia / minf / stbl / stts   sample counts + durations
+
+Callers should fall back to ``cv2.VideoCapture`` when :func:`read_mp4_video_info`
+returns ``None`` (fragmented MP4s, truncated files, non-MP4 input).
+"""
+
+import struct
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+_BOX_HEADER = struct.Struct(">I4s")
+_U32 = struct.Struct(">I")
+_U64 = struct.Struct(">Q")
+_STTS_ENTRY = struct.Struct(">II")
+
+
+def _iter_boxes(buf: bytes, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Yield (type, payload_start, box_end) for each child box in buf[start:end]."""
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = _BOX_HEADER.unpack_from(buf, offset)
+        header_size = 8
+        if size == 1:
+            if offset + 16 > end:
+                return
+            size = _U64.unpack_from(buf, offset + 8)[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size or offset + size > end:
+            return
+        yield box_type, offset + header_size, offset + size
+        offset += size
+
+
+def _find_box(buf: bytes, start: int, end: int, box_type: bytes) -> Optional[Tuple[int, int]]:
+    """Return (payload_start, box_end) of the first child box of the given type."""
+    for child_type, payload, box_end in _iter_boxes(buf, start, end):
+        if child_type == box_type:
+            return payload, box_end
+    return None
+
+
+def _read_moov(path: Union[str, Path]) -> Optional[bytes]:
+    """Walk the top-level boxes and return the raw ``moov`` box (header included)."""
+    with open(path, "rb") as fh:
+        offset = 0
+        first = True
+        while True:
+            fh.seek(offset)
+            header = fh.read(16)
+            if len(header) < 8:
+                return None
+            size, box_type = _BOX_HEADER.unpack_from(header, 0)
+            # Every MP4 starts with ftyp — bail out early on anything else
+            # (e.g. a .bag passed by mistake) instead of seeking through junk.
+            if first and box_type != b"ftyp":
+                return None
+            first = False
+            header_size = 8
+            if size == 1:
+                if len(header) < 16:
+                    return None
+                size = _U64.unpack_from(header, 8)[0]
+                header_size = 16
+            elif size == 0:
+                # Box extends to EOF — only meaningful if it is the moov itself
+                if box_type != b"moov":
+                    return None
+                fh.seek(offset)
+                return fh.read()
+            if size < header_size:
+                return None
+            if box_type == b"moov":
+                fh.seek(offset)
+                data = fh.read(size)
+                return data if len(data) == size else None
+            offset += size
+
+
+def read_mp4_video_info(path: Union[str, Path]) -> Optional[dict]:
+    """
+    Read frame count and frame rate of the first video track from the ``moov`` atom.
+
+    Args:
+        path: Path to an .mp4 file
+
+    Returns:
+        ``{"frames": int, "fps": float}`` or None if the container could not be
+        parsed (caller should fall back to OpenCV).
+    """
+    try:
+        moov = _read_moov(path)
+    except OSError:
+        return None
+    if not moov:
+        return None
+
+    try:
+        return _video_info_from_moov(moov)
+    except (struct.error, IndexError):
+        # Truncated/corrupt child box (e.g. an stts shorter than its header)
+        return None
+
+
+def _video_info_from_moov(moov: bytes) -> Optional[dict]:
+    """Parse the raw ``moov`` box; may raise struct.error/IndexError on truncated boxes."""
+    moov_payload = 16 if _U32.unpack_from(moov, 0)[0] == 1 else 8
+
+    for box_type, trak_start, trak_end in _iter_boxes(moov, moov_payload, len(moov)):
+        if box_type != b"trak":
+            continue
+        mdia = _find_box(moov, trak_start, trak_end, b"mdia")
+        if mdia is None:
+            continue
+
+        hdlr = _find_box(moov, mdia[0], mdia[1], b"hdlr")
+        # hdlr payload: version/flags (4) + pre_defined (4) + handler_type (4)
+        if hdlr is None or moov[hdlr[0] + 8:hdlr[0] + 12] != b"vide":
+            continue
+
+        timescale = 0
+        mdhd = _find_box(moov, mdia[0], mdia[1], b"mdhd")
+        if mdhd is not None:
+            version = moov[mdhd[0]]
+            # v0: vf(4) ctime(4) mtime(4) timescale | v1: vf(4) ctime(8) mtime(8) timescale
+            ts_offset = mdhd[0] + (20 if version == 1 else 12)
+            if ts_offset + 4 <= mdhd[1]:
+                timescale = _U32.unpack_from(moov, ts_offset)[0]
+
+        minf = _find_box(moov, mdia[0], mdia[1], b"minf")
+        stbl = _find_box(moov, minf[0], minf[1], b"stbl") if minf else None
+        stts = _find_box(moov, stbl[0], stbl[1], b"stts") if stbl else None
+        if stts is None:
+            return None
+
+        entry_count = _U32.unpack_from(moov, stts[0] + 4)[0]
+        entries_start = stts[0] + 8
+        if entries_start + entry_count * _STTS_ENTRY.size > stts[1]:
+            return None
+
+        frames = 0
+        ticks = 0
+        for count, delta in _STTS_ENTRY.iter_unpack(
+            moov[entries_start:entries_start + entry_count * _STTS_ENTRY.size]
+        ):
+            frames += count
+            ticks += count * delta
+
+        if frames <= 0:
+            # Fragmented MP4 (samples live in moof boxes) — let OpenCV handle it
+            return None
+
+        fps = round(frames * timescale / ticks, 3) if timescale and ticks else 0.0
+        return {"frames": frames, "fps": fps}
+
+    return None
@@ -10,17 +10,25 @@ All metrics are computed from actual frame data using YOLOv8-Pose on GPU.
 """
 
 import cv2
-import json
 import math
 import numpy as np
 import os
+import queue
 import time
 import threading
 import uuid
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Tuple, Optional
 
-from config import RECORDINGS_DIR, PROCESSED_DIR, MODELS_DIR, DEFAULT_FPS
+from config import (
+    RECORDINGS_DIR,
+    PROCESSED_DIR,
+    MODELS_DIR,
+    DEFAULT_FPS,
+    read_json_file,
+    write_json_file,
+)
 
 # Try to import pyrealsense2 for BAG file processing
 try:
@@ -32,6 +40,7 @@ except ImportError:
 
 # --- GPU AI ENGINE (YOLOv8-Pose via TensorRT) ---
 try:
+    import torch
     from ultralytics import YOLO
     HAS_GPU_AI = True
     print("[Processing] YOLOv8 (GPU) Available")
@@ -39,7 +48,15 @@ except ImportError:
     HAS_GPU_AI = False
     print("[Processing] YOLOv8 not installed.")
 
-MODEL_PATH = MODELS_DIR / "yolov8n-pose.engine"
+# TensorRT engines in order of preference: INT8 (calibrated) > FP16 > the
+# plain export name (FP16 when built with half=True, as in deploy/).
+ENGINE_CANDIDATES = [
+    MODELS_DIR / "yolov8n-pose-int8.engine",
+    MODELS_DIR / "yolov8n-pose-fp16.engine",
+    MODELS_DIR / "yolov8n-pose.engine",
+]
+
+MODEL_PATH = next((p for p in ENGINE_CANDIDATES if p.exists()), ENGINE_CANDIDATES[-1])
 if HAS_GPU_AI and not MODEL_PATH.exists():
     # Fallback to .pt if TensorRT engine not found
     fallback_path = MODELS_DIR / "yolov8n-pose.pt"
@@ -49,14 +66,66 @@ if HAS_GPU_AI and not MODEL_PATH.exists():
     else:
         print(f"[Processing] Warning: Neither .engine nor .pt model found. Will attempt to download .pt on first use.")
         MODEL_PATH = fallback_path
+elif HAS_GPU_AI:
+    print(f"[Processing] Using TensorRT engine {MODEL_PATH.name}")
 
-ai_model = None
-if HAS_GPU_AI:
-    try:
-        ai_model = YOLO(str(MODEL_PATH))
-    except Exception as e:
-        print(f"[Processing] Failed to load YOLO model from {MODEL_PATH}: {e}")
-        HAS_GPU_AI = False
+# Models are loaded lazily by acquire_model(). A missing .pt is still usable
+# (Ultralytics downloads it on first load); a missing engine never is.
+MODEL_AVAILABLE = HAS_GPU_AI and (MODEL_PATH.exists() or MODEL_PATH.suffix == ".pt")
+
+# YOLO instances are pooled: at most MODEL_SLOTS (one per camera of a job)
+# are ever loaded, since each TensorRT engine + context stays resident in
+# the Jetson's shared memory. Further jobs wait for a free slot.
+MODEL_SLOTS = 2
+_model_pool = queue.Queue()   # idle YOLO instances
+_model_pool_lock = threading.Lock()
+_models_loaded = 0
+
+
+def acquire_model(cancelled=None):
+    """
+    Borrow a YOLO instance for one process_video run.
+
+    Ultralytics predictors keep per-call state and must not be shared
+    between threads. Both cameras of a job run concurrently, so each gets
+    its own instance (its own TensorRT execution context); the two threads
+    still take turns on the GPU, since Ultralytics synchronises the device
+    around each stage. Instances are loaded on first use, up to MODEL_SLOTS;
+    after that callers wait for one to be returned with release_model().
+
+    Args:
+        cancelled: Optional callable polled while waiting; if it returns
+                   True, gives up and returns None.
+
+    Returns:
+        A YOLO instance, or None if cancelled while waiting.
+    """
+    global _models_loaded
+    with _model_pool_lock:
+        try:
+            return _model_pool.get_nowait()
+        except queue.Empty:
+            load = _models_loaded < MODEL_SLOTS
+            if load:
+                _models_loaded += 1
+    if load:
+        try:
+            return YOLO(str(MODEL_PATH))
+        except Exception:
+            with _model_pool_lock:
+                _models_loaded -= 1
+            raise
+    while True:
+        try:
+            return _model_pool.get(timeout=0.5)
+        except queue.Empty:
+            if cancelled is not None and cancelled():
+                return None
+
+
+def release_model(model):
+    """Return a YOLO instance borrowed with acquire_model() to the pool."""
+    _model_pool.put(model)
 
 
 # =============================================================================
@@ -72,6 +141,27 @@ ANALYSIS_CONFIG = {
     # Print YOLO inference details per frame (noisy; useful for debugging).
     "yolo_verbose": False,
 
+    # Frames sent to YOLO per inference call. Batching amortises the per-call
+    # launch/copy overhead, but a TensorRT engine only accepts it if it was
+    # exported with dynamic=True and batch ≥ this value (current
+    # deploy/setup_jetson.sh exports batch=8). Engines built by older setups
+    # have a fixed batch of 1 — keep 1 unless the engine has been rebuilt.
+    "inference_batch_size": 1,
+
+    # Longest side (px) frames are downscaled to before inference. Match the
+    # imgsz the TensorRT engine was exported with (640 by default).
+    "inference_imgsz": 640,
+
+    # ---- Motion gate (adaptive frame skipping) ----
+    # Skip YOLO on frames whose downscaled greyscale image differs from the
+    # last inferred frame by less than this mean grey level (0-255) and reuse
+    # the previous keypoints. 0 = disabled (every frame is inferred).
+    "motion_gate_threshold": 0,
+
+    # Inference is forced at least every N frames while the gate is active,
+    # so genuine small jitter (tremor) is still sampled.
+    "motion_gate_force_every": 5,
+
     # ---- Keypoints to track for motion calculation ----
     # Subset of the 5 head keypoints returned by extract_yolo_landmarks().
     # Available keys: "nose", "left_eye", "right_eye", "ears"
@@ -125,6 +215,24 @@ dict — **without touching any other code** — to tune the pipeline behaviour:
    * - ``yolo_verbose``
      - ``False``
      - Print per-frame inference details (noisy; useful for debugging).
+   * - ``inference_batch_size``
+     - ``1``
+     - Frames per YOLO inference call. Raise (e.g. to ``8``) only with an
+       engine exported with ``dynamic=True`` and ``batch`` ≥ this value;
+       older engines have a fixed batch of 1.
+   * - ``inference_imgsz``
+     - ``640``
+     - Longest side frames are downscaled to before inference (match the
+       engine's export ``imgsz``). Keypoints are mapped back to source pixels.
+   * - ``motion_gate_threshold``
+     - ``0``
+     - Skip inference on frames whose 160x90 greyscale thumbnail differs from
+       the last inferred frame by less than this mean grey level; the previous
+       keypoints are reused. ``0`` disables the gate.
+   * - ``motion_gate_force_every``
+     - ``5``
+     - While gating, force inference at least every N frames so tremor
+       jitter is still sampled.
    * - ``motion_keypoints``
      - *5 head kps*
      - Subset of head keypoints used for motion calculation.
@@ -160,6 +268,11 @@ dict — **without touching any other code** — to tune the pipeline behaviour:
 processing_jobs: Dict[str, dict] = {}
 processing_lock = threading.Lock()
 
+# Per-job cancel flags, kept out of processing_jobs (whose dicts are returned
+# as JSON). Workers poll them without taking processing_lock; the lock is
+# only needed to create/cancel jobs and for status transitions.
+_job_cancel_events: Dict[str, threading.Event] = {}
+
 
 # =============================================================================
 #                          BAG FILE READER
@@ -169,9 +282,15 @@ class BagFileReader:
     """
     Read frames from a RealSense BAG file.
     Provides an iterator interface similar to cv2.VideoCapture.
+
+    With a ring of ``ring_size`` > 0 buffers (constructor or
+    :meth:`allocate_ring`), frames are written into preallocated buffers
+    instead of a fresh array per read. A returned frame is then only valid
+    until ``ring_size`` further reads — the caller must size the ring to
+    cover every frame it holds at once.
     """
     
-    def __init__(self, bag_path: str):
+    def __init__(self, bag_path: str, ring_size: int = 0):
         if not HAS_REALSENSE:
             raise RuntimeError("pyrealsense2 not available")
         
@@ -179,8 +298,12 @@ class BagFileReader:
         self.pipeline = rs.pipeline()
         self.config = rs.config()
         
-        # Enable playback from BAG file
+        # Enable playback from BAG file — colour only, so the depth stream
+        # recorded alongside it is never decoded. No format/resolution
+        # constraints: the SDK fails to resolve them unless they exactly match
+        # what was recorded (same as conversion.py).
         rs.config.enable_device_from_file(self.config, bag_path, repeat_playback=False)
+        self.config.enable_stream(rs.stream.color)
         
         # Start pipeline
         self.profile = self.pipeline.start(self.config)
@@ -194,6 +317,11 @@ class BagFileReader:
         self.width = color_stream.width()
         self.height = color_stream.height()
         self.fps = color_stream.fps()
+        # Our recorder writes bgr8 (camera.py), which OpenCV/YOLO use as-is;
+        # only older/external rgb8 BAGs need a channel swap per frame
+        self._rgb_input = color_stream.format() == rs.format.rgb8
+
+        self.allocate_ring(ring_size)
         
         # Estimate frame count from duration
         # BAG files don't directly expose frame count, so we estimate
@@ -201,6 +329,11 @@ class BagFileReader:
         self._frames_read = 0
         self._is_open = True
     
+    def allocate_ring(self, ring_size: int):
+        """(Re)allocate the output ring; 0 = a fresh array per read."""
+        self._ring = [np.empty((self.height, self.width, 3), dtype=np.uint8) for _ in range(ring_size)]
+        self._ring_idx = 0
+
     def isOpened(self) -> bool:
         return self._is_open
     
@@ -223,7 +356,17 @@ class BagFileReader:
             return False, None
         
         try:
-            frames = self.pipeline.wait_for_frames(timeout_ms=ANALYSIS_CONFIG["bag_frame_timeout_ms"])
+            # Wait in short slices so end-of-file is noticed as soon as
+            # playback stops, instead of after the full frame timeout
+            deadline = time.monotonic() + ANALYSIS_CONFIG["bag_frame_timeout_ms"] / 1000
+            while True:
+                ok, frames = self.pipeline.try_wait_for_frames(timeout_ms=100)
+                if ok:
+                    break
+                if (self.playback.current_status() == rs.playback_status.stopped
+                        or time.monotonic() >= deadline):
+                    self.release()
+                    return False, None
             color_frame = frames.get_color_frame()
             
             if not color_frame:
@@ -232,16 +375,28 @@ class BagFileReader:
             # Convert to numpy array (BGR format for OpenCV compatibility)
             frame = np.asanyarray(color_frame.get_data())
             
-            # RealSense gives RGB, OpenCV expects BGR
-            if len(frame.shape) == 3 and frame.shape[2] == 3:
+            # Callers hold several frames at once (batched inference), so
+            # always copy out of the SDK buffer — otherwise its frame pool is
+            # exhausted. Swap channels only if the BAG was recorded as RGB.
+            if self._ring and frame.shape == self._ring[0].shape:
+                buf = self._ring[self._ring_idx]
+                self._ring_idx = (self._ring_idx + 1) % len(self._ring)
+                if self._rgb_input:
+                    cv2.cvtColor(frame, cv2.COLOR_RGB2BGR, dst=buf)
+                else:
+                    np.copyto(buf, frame)
+                frame = buf
+            elif self._rgb_input:
                 frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+            else:
+                frame = frame.copy()
             
             self._frames_read += 1
             return True, frame
             
         except RuntimeError:
             # End of file or error
-            self._is_open = False
+            self.release()
             return False, None
     
     def release(self):
@@ -261,24 +416,109 @@ class BagFileReader:
         return False
 
 
+# Decoded frames buffered ahead of inference (see _decode_worker)
+FRAME_PREFETCH = 32
+
+# Queued in place of a frame the motion gate decided not to run through YOLO
+GATED_FRAME = object()
+
+# Size (w, h) of the greyscale thumbnail compared by the motion gate
+MOTION_GATE_SIZE = (160, 90)
+
+
+def _put_until_stopped(frame_q: queue.Queue, item, stop: threading.Event) -> bool:
+    """Put item on frame_q, giving up if stop is set while the queue is full."""
+    while not stop.is_set():
+        try:
+            frame_q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _decode_worker(cap, frame_q: queue.Queue, stop: threading.Event,
+                   resize_to: Optional[Tuple[int, int]] = None, ring_size: int = 0):
+    """
+    Decode frames from cap into frame_q until EOF or stop is set.
+
+    Runs in its own thread so decoding overlaps GPU inference. A None
+    sentinel marks the end of the stream (not sent when stopped — the
+    consumer has already gone).
+
+    With ``resize_to`` (w, h), frames are downscaled (INTER_AREA) into a
+    ring of ``ring_size`` preallocated buffers before being queued.
+
+    If ``ANALYSIS_CONFIG["motion_gate_threshold"]`` is set, frames that
+    barely differ from the last frame sent to inference are queued as
+    GATED_FRAME instead (at most ``motion_gate_force_every - 1`` in a row).
+    """
+    ring = []
+    if resize_to:
+        ring = [np.empty((resize_to[1], resize_to[0], 3), dtype=np.uint8) for _ in range(max(ring_size, 1))]
+    ring_idx = 0
+
+    gate_threshold = ANALYSIS_CONFIG["motion_gate_threshold"]
+    gate_max_run = max(ANALYSIS_CONFIG["motion_gate_force_every"] - 1, 0)
+    gate_ref = None
+    gated_run = 0
+    try:
+        while not stop.is_set():
+            ret, frame = cap.read()
+            if not ret:
+                break
+            if ring:
+                buf = ring[ring_idx]
+                ring_idx = (ring_idx + 1) % len(ring)
+                cv2.resize(frame, resize_to, dst=buf, interpolation=cv2.INTER_AREA)
+                frame = buf
+
+            item = frame
+            if gate_threshold:
+                # Mean absolute grey-level difference against the last frame
+                # that went to inference (not the previous frame, so slow
+                # drift can't accumulate unseen across skipped frames)
+                small = cv2.cvtColor(
+                    cv2.resize(frame, MOTION_GATE_SIZE, interpolation=cv2.INTER_AREA),
+                    cv2.COLOR_BGR2GRAY,
+                )
+                if (gate_ref is not None and gated_run < gate_max_run
+                        and cv2.norm(small, gate_ref, cv2.NORM_L1) / small.size < gate_threshold):
+                    item = GATED_FRAME
+                    gated_run += 1
+                else:
+                    gate_ref = small
+                    gated_run = 0
+
+            _put_until_stopped(frame_q, item, stop)
+    finally:
+        # End-of-stream sentinel. The queue is usually full at EOF (decode
+        # outpaces inference), so this must also give up once stopped.
+        _put_until_stopped(frame_q, None, stop)
+
+
 # =============================================================================
 #                          PROGRESS HELPERS
 # =============================================================================
 
 def update_job_progress(job_id: str, camera_num: int, progress: int, step_name: str):
-    """Update processing job progress."""
-    with processing_lock:
-        if job_id in processing_jobs:
-            processing_jobs[job_id][f"camera{camera_num}_progress"] = progress
-            processing_jobs[job_id][f"camera{camera_num}_step"] = step_name
+    """
+    Update processing job progress.
+
+    Lock-free: each camera thread only writes its own two keys, and single
+    dict stores are atomic under the GIL (a status reader may at worst see
+    the new progress with the previous step text).
+    """
+    job = processing_jobs.get(job_id)
+    if job is not None:
+        job[f"camera{camera_num}_progress"] = progress
+        job[f"camera{camera_num}_step"] = step_name
 
 
 def check_job_cancelled(job_id: str) -> bool:
-    """Check if job was cancelled."""
-    with processing_lock:
-        if job_id not in processing_jobs:
-            return True
-        return processing_jobs[job_id]["status"] == "cancelled"
+    """Check if job was cancelled (lock-free, see _job_cancel_events)."""
+    event = _job_cancel_events.get(job_id)
+    return event is None or event.is_set()
 
 
 # =============================================================================
@@ -290,107 +530,136 @@ def check_job_cancelled(job_id: str) -> bool:
 YOLO_KEYPOINT_NAMES = ["nose", "left_eye", "right_eye", "left_ear", "right_ear"]
 
 
-def extract_yolo_landmarks(results):
+def extract_yolo_landmarks(results) -> Optional[np.ndarray]:
     """
-    Extract pose keypoints from YOLOv8-Pose results.
+    Extract head keypoints from YOLOv8-Pose results.
 
     YOLO Pose returns 17 keypoints per person.
     Indices: 0:Nose, 1:L-Eye, 2:R-Eye, 3:L-Ear, 4:R-Ear
 
     Returns:
-        Dictionary with named keypoint groups, or None if no person detected.
+        float32 array of shape (5, 2) with the (x, y) of each head keypoint
+        (rows ordered as YOLO_KEYPOINT_NAMES), or None if no person detected.
     """
     if not results or len(results) == 0:
         return None
+    return extract_yolo_landmarks_batch(results[:1])[0]
 
-    # Get the first person detected
-    if not results[0].keypoints or not results[0].keypoints.xy.numel():
-        return None
 
-    keypoints = results[0].keypoints.xy.cpu().numpy()[0]
+def extract_yolo_landmarks_batch(results_list, inv_scale: float = 1.0) -> list:
+    """
+    Extract head keypoints for every frame of a batched YOLOv8-Pose call.
+
+    The first person's 5 head keypoints of each frame are sliced on the
+    device and stacked, so the whole batch crosses to the host in a single
+    copy (one device sync per batch instead of one per frame).
 
-    # Check if we have enough points (at least 5 for face)
-    if keypoints.shape[0] < 5:
-        return None
+    Args:
+        results_list: Results of one batched YOLO call
+        inv_scale: Factor mapping keypoints back to source pixels when the
+                   frames were downscaled before inference
 
-    landmarks = {
-        "nose": [{"x": float(keypoints[0][0]), "y": float(keypoints[0][1])}],
-        "left_eye": [{"x": float(keypoints[1][0]), "y": float(keypoints[1][1])}],
-        "right_eye": [{"x": float(keypoints[2][0]), "y": float(keypoints[2][1])}],
+    Returns:
+        One entry per result: a (5, 2) float32 array, or None if no person
+        was detected in that frame.
+    """
+    rows = []
+    detected = []
+    for result in results_list:
+        kps = result.keypoints
+        # Need a person with at least 5 keypoints (face)
+        ok = bool(kps) and kps.xy.numel() > 0 and kps.xy.shape[1] >= 5
+        if ok:
+            rows.append(kps.xy[0, :5])
+        detected.append(ok)
+
+    if not rows:
+        return [None] * len(detected)
+
+    host = torch.stack(rows).cpu().numpy().astype(np.float32, copy=False)
+    if inv_scale != 1.0:
+        host *= inv_scale
+    host_rows = iter(host)
+    return [next(host_rows) if ok else None for ok in detected]
+
+
+def landmarks_to_dict(keypoints: np.ndarray) -> dict:
+    """Convert a (5, 2) keypoint array to the named layout used in the JSON report."""
+    (nx, ny), (lex, ley), (rex, rey), (lax, lay), (rax, ray) = keypoints.tolist()
+    return {
+        "nose": [{"x": nx, "y": ny}],
+        "left_eye": [{"x": lex, "y": ley}],
+        "right_eye": [{"x": rex, "y": rey}],
         "ears": [
-            {"x": float(keypoints[3][0]), "y": float(keypoints[3][1])},  # Left Ear
-            {"x": float(keypoints[4][0]), "y": float(keypoints[4][1])}   # Right Ear
+            {"x": lax, "y": lay},  # Left Ear
+            {"x": rax, "y": ray}   # Right Ear
         ]
     }
-    return landmarks
 
 
-def analyze_tremor_yolo(history: list) -> float:
-    """Simple tremor detection based on Nose X/Y movement variance (jitter)."""
-    if len(history) < 10:
+def analyze_tremor_yolo(nose_x: np.ndarray) -> float:
+    """
+    Simple tremor detection based on Nose X movement variance (jitter).
+
+    Args:
+        nose_x: Nose X positions, one per detected frame
+                (a view into the keypoint history, e.g. ``kp_history[:n, 0, 0]``)
+    """
+    if nose_x.size < 10:
         return 0.0
+    return float(np.var(nose_x))
 
-    nose_x = [frame["nose"][0]["x"] for frame in history if frame and "nose" in frame]
 
-    if not nose_x:
-        return 0.0
-    variance = np.var(nose_x)
-    return float(variance)
+def motion_keypoint_mask() -> np.ndarray:
+    """
+    Boolean mask over the 5 head keypoint rows selected by
+    ANALYSIS_CONFIG["motion_keypoints"] ("ears" selects both ear rows).
+    """
+    motion_kps = ANALYSIS_CONFIG.get("motion_keypoints", ["nose", "left_eye", "right_eye", "ears"])
+    return np.array([
+        "nose" in motion_kps,
+        "left_eye" in motion_kps,
+        "right_eye" in motion_kps,
+        "ears" in motion_kps,
+        "ears" in motion_kps,
+    ])
 
 
-def calculate_keypoint_motion(prev_landmarks: dict, curr_landmarks: dict) -> dict:
+def calculate_keypoint_motion(prev_kps: np.ndarray, curr_kps: np.ndarray,
+                              mask: Optional[np.ndarray] = None) -> dict:
     """
     Calculate motion between two frames based on YOLO keypoint positions.
 
+    Args:
+        prev_kps: (5, 2) keypoints of the previous frame
+        curr_kps: (5, 2) keypoints of the current frame
+        mask: Rows to include (defaults to motion_keypoint_mask())
+
     Returns:
         Dictionary with total, average, and max motion across tracked keypoints.
     """
-    if not prev_landmarks or not curr_landmarks:
+    if prev_kps is None or curr_kps is None:
         return {"total_motion": 0, "average_motion": 0, "max_point_motion": 0, "points_tracked": 0}
 
-    total_motion = 0.0
-    point_motions = []
+    if mask is None:
+        mask = motion_keypoint_mask()
 
-    # Use only the configured keypoints for motion calculation
-    motion_kps = ANALYSIS_CONFIG.get("motion_keypoints", ["nose", "left_eye", "right_eye", "ears"])
+    # YOLOv8-Pose reports undetected keypoints as (0, 0) — only keep points
+    # that are valid in both frames
+    valid = mask & (curr_kps > 0).any(axis=1) & (prev_kps > 0).any(axis=1)
+    diff = curr_kps[valid] - prev_kps[valid]
+    dists = np.sqrt((diff * diff).sum(axis=1))
 
-    for key in [k for k in ["nose", "left_eye", "right_eye"] if k in motion_kps]:
-        prev_pts = prev_landmarks.get(key, [])
-        curr_pts = curr_landmarks.get(key, [])
-        if prev_pts and curr_pts:
-            # Check if either point has zero confidence (failed detection)
-            # YOLOv8-Pose usually gives (0,0) with conf < threshold
-            # Assume we only use points with valid confidence if available, 
-            # or check coordinates > 0
-            if (curr_pts[0]["x"] > 0 or curr_pts[0]["y"] > 0) and \
-               (prev_pts[0]["x"] > 0 or prev_pts[0]["y"] > 0):
-                dx = curr_pts[0]["x"] - prev_pts[0]["x"]
-                dy = curr_pts[0]["y"] - prev_pts[0]["y"]
-                dist = np.sqrt(dx * dx + dy * dy)
-                point_motions.append(dist)
-                total_motion += dist
-
-    # Ears (list of 2) — optional based on config
-    if "ears" in motion_kps:
-        prev_ears = prev_landmarks.get("ears", [])
-        curr_ears = curr_landmarks.get("ears", [])
-        for i in range(min(len(prev_ears), len(curr_ears))):
-            if (curr_ears[i]["x"] > 0 or curr_ears[i]["y"] > 0) and \
-               (prev_ears[i]["x"] > 0 or prev_ears[i]["y"] > 0):
-                dx = curr_ears[i]["x"] - prev_ears[i]["x"]
-                dy = curr_ears[i]["y"] - prev_ears[i]["y"]
-                dist = np.sqrt(dx * dx + dy * dy)
-                point_motions.append(dist)
-                total_motion += dist
-
-    avg_motion = total_motion / max(len(point_motions), 1)
-    max_motion = max(point_motions) if point_motions else 0
+    points_tracked = int(dists.size)
+    total_motion = float(dists.sum())
+    avg_motion = total_motion / max(points_tracked, 1)
+    max_motion = float(dists.max()) if points_tracked else 0
 
     return {
         "total_motion": round(total_motion, 3),
         "average_motion": round(avg_motion, 3),
         "max_point_motion": round(max_motion, 3),
-        "points_tracked": len(point_motions)
+        "points_tracked": points_tracked
     }
 
 
@@ -484,7 +753,7 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
         meta_fps: float | None = None
         if metadata_file.exists():
             try:
-                patient_info = json.loads(metadata_file.read_text())
+                patient_info = read_json_file(metadata_file)
                 raw_meta_fps = patient_info.get("fps")
                 if raw_meta_fps and float(raw_meta_fps) > 0:
                     meta_fps = float(raw_meta_fps)
@@ -506,6 +775,8 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
         if not video_file.exists():
             raise FileNotFoundError(f"Video file not found: {video_file}")
 
+        batch_size = max(1, int(ANALYSIS_CONFIG["inference_batch_size"]))
+
         # Use appropriate reader based on file type
         if use_bag:
             cap = BagFileReader(str(video_file))
@@ -514,7 +785,7 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
             # 1. Try metadata JSON (most accurate if recording finished cleanly)
             if metadata_file.exists():
                 try:
-                    meta = json.loads(metadata_file.read_text())
+                    meta = read_json_file(metadata_file)
                     total_frames = meta.get("bag_frames") or meta.get("mp4_frames") or -1
                 except:
                     pass
@@ -543,6 +814,21 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
         height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         duration = total_frames / fps if total_frames > 0 and fps > 0 else 0
 
+        # Downscale to the inference size up front (YOLO would letterbox to
+        # it anyway) — less preprocessing and host->device traffic per frame.
+        # Keypoints are scaled back to source pixels, so thresholds still apply.
+        imgsz = ANALYSIS_CONFIG["inference_imgsz"]
+        scale = imgsz / max(width, height) if width > 0 and height > 0 else 1.0
+        resize_to = (int(width * scale), int(height * scale)) if scale < 1.0 else None
+        inv_scale = 1.0 / scale if resize_to else 1.0
+
+        # Frames alive at once: the prefetch queue, the batch being inferred
+        # and the one being decoded (+1 spare). When resizing, the decode
+        # thread copies out of the reader's buffer immediately.
+        frames_alive = FRAME_PREFETCH + batch_size + 2
+        if use_bag:
+            cap.allocate_ring(2 if resize_to else frames_alive)
+
         video_info = {
             "frames": total_frames,
             "fps": fps,
@@ -564,85 +850,154 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
 
         update_job_progress(job_id, camera_num, 13, "Processing frames with pose detection...")
 
-        if not HAS_GPU_AI or ai_model is None:
+        if not MODEL_AVAILABLE:
             raise RuntimeError("YOLOv8-Pose not available. Cannot process video without GPU AI engine.")
 
         # Accumulators for metrics
         frame_landmarks_list = []  # Store landmarks for each frame (sampled)
-        landmark_history = []      # Recent landmarks for tremor analysis
-        motion_history = []
+        # Per-detection history as flat arrays instead of per-frame dicts:
+        #   kp_history[i]  - (5, 2) head keypoints of the i-th detected frame
+        #   motion_avg[i]  - average keypoint motion of the i-th motion sample
+        # Preallocated from the frame estimate, doubled if the stream is longer.
+        history_cap = max(total_frames, 1024)
+        kp_history = np.empty((history_cap, 5, 2), dtype=np.float32)
+        motion_avg = np.empty(history_cap, dtype=np.float32)
+        kp_count = 0
+        motion_count = 0
         persons_detected = 0
         persons_not_detected = 0
 
         prev_landmarks = None
         frames_processed = 0
+        frames_gated = 0
+        motion_mask = motion_keypoint_mask()
+
+        sample_interval = ANALYSIS_CONFIG["landmark_sample_every_n_frames"]
+        progress_every = ANALYSIS_CONFIG["progress_update_every_n_frames"]
+        eof = False
+
+        # Decode in a background thread so the next frames are ready while
+        # the GPU works on the current batch
+        frame_q = queue.Queue(maxsize=FRAME_PREFETCH)
+        decode_stop = threading.Event()
+        decoder = threading.Thread(
+            target=_decode_worker,
+            args=(cap, frame_q, decode_stop, resize_to, frames_alive),
+            name=f"decode-cam{camera_num}",
+            daemon=True,
+        )
 
-        while True:
-            if check_job_cancelled(job_id):
-                cap.release()
-                return
-
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            frame_data = {
-                "frame_number": frames_processed,
-                "person_detected": False,
-                "landmarks": None,
-                "motion": None
-            }
-
-            # Run YOLOv8-Pose inference on GPU
-            results = ai_model(
-                frame,
-                verbose=ANALYSIS_CONFIG["yolo_verbose"],
-                device=ANALYSIS_CONFIG["yolo_device"],
-            )
-            landmarks = extract_yolo_landmarks(results)
-
-            if landmarks is not None:
-                persons_detected += 1
-                frame_data["person_detected"] = True
-
-                # Store for tremor analysis
-                landmark_history.append(landmarks)
-
-                # Calculate motion from previous frame
-                if prev_landmarks is not None:
-                    motion = calculate_keypoint_motion(prev_landmarks, landmarks)
-                    motion_history.append(motion)
-                    frame_data["motion"] = motion
-
-                prev_landmarks = landmarks
-
-                # Sample landmarks (configurable interval to keep JSON size manageable)
-                sample_interval = ANALYSIS_CONFIG["landmark_sample_every_n_frames"]
-                if frames_processed % sample_interval == 0:
-                    frame_data["landmarks"] = landmarks
-                    frame_landmarks_list.append(frame_data)
-            else:
-                persons_not_detected += 1
-                prev_landmarks = None
-
-            frames_processed += 1
-
-            # Update progress (12% to 90% = 78% range for frame processing)
-            if frames_processed % ANALYSIS_CONFIG["progress_update_every_n_frames"] == 0:
-                if total_frames > 0:
-                    pct_complete = min(frames_processed / total_frames, 1.0)
-                    progress = 12 + int(pct_complete * 78)
-                    frame_msg = f"Frame {frames_processed}/{total_frames} ({int(pct_complete*100)}%)"
-                else:
-                    # Logarithmic fallback if total_frames completely unknown
-                    REF_FRAMES = 6000
-                    progress = 12 + int(78 * math.log1p(frames_processed) / math.log1p(REF_FRAMES))
-                    progress = min(progress, 89)
-                    frame_msg = f"Frame {frames_processed} (detections: {persons_detected})"
+        # One YOLO instance per running camera (waits if both are in use)
+        try:
+            model = acquire_model(lambda: check_job_cancelled(job_id))
+        except Exception:
+            cap.release()
+            raise
+        if model is None:
+            cap.release()
+            return
 
-                update_job_progress(job_id, camera_num, progress, frame_msg)
+        decoder.start()
 
-        cap.release()
+        try:
+            while not eof:
+                if check_job_cancelled(job_id):
+                    return
+
+                # Collect decoded frames until batch_size of them need
+                # inference (gated frames ride along in order)
+                batch_items = []
+                batch_frames = []
+                while len(batch_frames) < batch_size:
+                    item = frame_q.get()
+                    if item is None:
+                        eof = True
+                        break
+                    batch_items.append(item)
+                    if item is not GATED_FRAME:
+                        batch_frames.append(item)
+                if not batch_items:
+                    break
+
+                # Run YOLOv8-Pose inference on GPU for the whole batch
+                batch_landmarks = iter(())
+                if batch_frames:
+                    results_list = model(
+                        batch_frames,
+                        imgsz=imgsz,
+                        verbose=ANALYSIS_CONFIG["yolo_verbose"],
+                        device=ANALYSIS_CONFIG["yolo_device"],
+                    )
+                    batch_landmarks = iter(extract_yolo_landmarks_batch(results_list, inv_scale))
+
+                # Walk the batch in frame order, so motion is still computed
+                # between consecutive frames
+                for item in batch_items:
+                    if item is GATED_FRAME:
+                        # No visible change: reuse the previous keypoints
+                        # (zero motion for this frame)
+                        frames_gated += 1
+                        landmarks = prev_landmarks
+                    else:
+                        landmarks = next(batch_landmarks)
+
+                    frame_data = {
+                        "frame_number": frames_processed,
+                        "person_detected": False,
+                        "landmarks": None,
+                        "motion": None
+                    }
+
+                    if landmarks is not None:
+                        persons_detected += 1
+                        frame_data["person_detected"] = True
+
+                        # Store for tremor analysis
+                        if kp_count == kp_history.shape[0]:
+                            kp_history = np.concatenate((kp_history, np.empty_like(kp_history)))
+                        kp_history[kp_count] = landmarks
+                        kp_count += 1
+
+                        # Calculate motion from previous frame
+                        if prev_landmarks is not None:
+                            motion = calculate_keypoint_motion(prev_landmarks, landmarks, motion_mask)
+                            if motion_count == motion_avg.shape[0]:
+                                motion_avg = np.concatenate((motion_avg, np.empty_like(motion_avg)))
+                            motion_avg[motion_count] = motion["average_motion"]
+                            motion_count += 1
+                            frame_data["motion"] = motion
+
+                        prev_landmarks = landmarks
+
+                        # Sample landmarks (configurable interval to keep JSON size manageable)
+                        if frames_processed % sample_interval == 0:
+                            frame_data["landmarks"] = landmarks_to_dict(landmarks)
+                            frame_landmarks_list.append(frame_data)
+                    else:
+                        persons_not_detected += 1
+                        prev_landmarks = None
+
+                    frames_processed += 1
+
+                    # Update progress (12% to 90% = 78% range for frame processing)
+                    if frames_processed % progress_every == 0:
+                        if total_frames > 0:
+                            pct_complete = min(frames_processed / total_frames, 1.0)
+                            progress = 12 + int(pct_complete * 78)
+                            frame_msg = f"Frame {frames_processed}/{total_frames} ({int(pct_complete*100)}%)"
+                        else:
+                            # Logarithmic fallback if total_frames completely unknown
+                            REF_FRAMES = 6000
+                            progress = 12 + int(78 * math.log1p(frames_processed) / math.log1p(REF_FRAMES))
+                            progress = min(progress, 89)
+                            frame_msg = f"Frame {frames_processed} (detections: {persons_detected})"
+
+                        update_job_progress(job_id, camera_num, progress, frame_msg)
+        finally:
+            decode_stop.set()
+            decoder.join()
+            cap.release()
+            release_model(model)
 
         # Update total_frames now that we know the actual count
         if total_frames <= 0:
@@ -664,8 +1019,8 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
         detection_rate = persons_detected / max(total_detection_frames, 1)
 
         # Motion statistics
-        if motion_history:
-            avg_motions = [m.get("average_motion", 0) for m in motion_history]
+        if motion_count:
+            avg_motions = motion_avg[:motion_count]
             avg_motion = float(np.mean(avg_motions))
             motion_std = float(np.std(avg_motions))
             motion_max = float(np.max(avg_motions))
@@ -674,7 +1029,7 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
             avg_motion = motion_std = motion_max = motion_min = 0.0
 
         # Tremor analysis (nose jitter variance) using configurable thresholds
-        tremor_variance = analyze_tremor_yolo(landmark_history)
+        tremor_variance = analyze_tremor_yolo(kp_history[:kp_count, 0, 0])
         tt = ANALYSIS_CONFIG["tremor_thresholds"]
         tremor_severity = (
             "None"     if tremor_variance < tt["mild"]
@@ -709,7 +1064,7 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
             try:
                 meta_file = RECORDINGS_DIR / f"{batch_id}_camera{camera_num}_metadata.json"
                 if meta_file.exists():
-                    _meta = json.loads(meta_file.read_text())
+                    _meta = read_json_file(meta_file)
                     mp4_frame_count = _meta.get("mp4_frames")
             except Exception:
                 pass
@@ -754,6 +1109,7 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
                 "persons_detected": persons_detected,
                 "persons_not_detected": persons_not_detected,
                 "detection_rate": round(detection_rate * 100, 1),
+                "frames_motion_gated": frames_gated,
                 "engine": "YOLOv8-Pose (TensorRT/GPU)" if HAS_GPU_AI else "N/A"
             },
 
@@ -789,14 +1145,14 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
         
         if metadata_file.exists():
             try:
-                meta = json.loads(metadata_file.read_text())
+                meta = read_json_file(metadata_file)
                 meta["processing_duration_s"] = duration
                 
                 conv_dur = meta.get("conversion_duration_s")
                 if conv_dur:
                      meta["total_duration_s"] = round(duration + float(conv_dur), 2)
                      
-                metadata_file.write_text(json.dumps(meta, indent=2))
+                write_json_file(metadata_file, meta)
                 print(f"[Processing] Updated metadata with duration: {duration}s")
             except Exception as e:
                 print(f"[Processing] Failed to update metadata duration: {e}")
@@ -812,7 +1168,7 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
         note = ""
         if metadata_file.exists():
             try:
-                meta = json.loads(metadata_file.read_text())
+                meta = read_json_file(metadata_file)
                 patient_id = meta.get("patient_id", "")
                 note = meta.get("note", "")
             except:
@@ -827,7 +1183,7 @@ def process_video(job_id: str, camera_num: int, batch_id: str):
         result_filename = "_".join(name_parts) + ".json"
         
         result_path = PROCESSED_DIR / result_filename
-        result_path.write_text(json.dumps(result_data, indent=2))
+        write_json_file(result_path, result_data)
         print(f"[Processing] Saved: {result_path}")
         
         update_job_progress(job_id, camera_num, 100, "Complete")
@@ -902,6 +1258,7 @@ def create_processing_job(batch_id: str, has_cam1: bool, has_cam2: bool) -> str:
             "camera1_result": None,
             "camera2_result": None
         }
+        _job_cancel_events[job_id] = threading.Event()
     
     return job_id
 
@@ -920,6 +1277,7 @@ def cancel_job(job_id: str) -> bool:
         processing_jobs[job_id]["status"] = "cancelled"
         processing_jobs[job_id]["camera1_status"] = "cancelled"
         processing_jobs[job_id]["camera2_status"] = "cancelled"
+        _job_cancel_events[job_id].set()
     return True
 
 
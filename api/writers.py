@@ -11,6 +11,8 @@ Writer classes used across the recording and conversion pipelines:
       (:mod:`conversion`) and the ``/recordings/fix-mp4-codec`` maintenance route.
     - **create_mp4_writer**: Factory that prefers FFmpegWriter and falls back to
       OpenCV's ``VideoWriter`` when FFmpeg is unavailable.
+    - **detect_hw_encoder**: Picks the first hardware H.264 encoder the bundled
+      FFmpeg build offers (NVENC, VideoToolbox, QSV, V4L2 M2M), else libx264.
 
 .. note::
    During live recording only .bag files are written. MP4 files are produced
@@ -20,11 +22,12 @@ Writer classes used across the recording and conversion pipelines:
 import cv2
 import subprocess
 import threading
+from functools import lru_cache
 from typing import Tuple, Union, Optional
 
 from config import (
     FFMPEG_AVAILABLE,
-    imageio_ffmpeg,
+    FFMPEG_PATH,
     REALSENSE_AVAILABLE,
     rs,
     CAMERA_TYPE_REALSENSE,
@@ -199,6 +202,57 @@ def stop_realsense_recording(pipeline) -> bool:
         return False
 
 
+# =============================================================================
+#                          H.264 ENCODER SELECTION
+# =============================================================================
+
+# FFmpeg H.264 encoder arguments, hardware encoders first (preference order).
+# Quality settings are roughly equivalent to libx264 -crf 23.
+H264_ENCODER_ARGS = {
+    "h264_nvenc":        ["-c:v", "h264_nvenc", "-preset", "p4", "-cq", "23"],
+    "h264_videotoolbox": ["-c:v", "h264_videotoolbox", "-b:v", "6M"],
+    "h264_qsv":          ["-c:v", "h264_qsv", "-preset", "medium", "-global_quality", "23"],
+    "h264_v4l2m2m":      ["-c:v", "h264_v4l2m2m", "-b:v", "6M"],
+    "libx264":           ["-c:v", "libx264", "-preset", "fast", "-crf", "23"],
+}
+
+
+@lru_cache(maxsize=1)
+def detect_hw_encoder() -> str:
+    """
+    Return the first hardware H.264 encoder listed by ``ffmpeg -encoders``.
+
+    Runs ffmpeg once per process (result cached). Falls back to ``"libx264"``
+    when FFmpeg is unavailable or no hardware encoder is compiled in.
+
+    .. note::
+       An encoder being compiled in does not guarantee the hardware is present,
+       so callers should retry with libx264 if the hardware encode fails.
+    """
+    if not FFMPEG_PATH:
+        return "libx264"
+
+    try:
+        result = subprocess.run(
+            [FFMPEG_PATH, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10
+        )
+        # Lines look like " V....D h264_nvenc   NVIDIA NVENC H.264 encoder"
+        available = {
+            parts[1] for parts in (line.split() for line in result.stdout.splitlines())
+            if len(parts) >= 2
+        }
+    except Exception as e:
+        print(f"[Writer] Encoder detection failed: {e}")
+        return "libx264"
+
+    for encoder in H264_ENCODER_ARGS:
+        if encoder in available:
+            print(f"[Writer] H.264 encoder: {encoder}")
+            return encoder
+    return "libx264"
+
+
 # =============================================================================
 #                          FFMPEG WRITER (RECOMMENDED MP4)
 # =============================================================================
@@ -222,9 +276,8 @@ class FFmpegWriter:
     def _start(self):
         """Start FFmpeg subprocess."""
         try:
-            ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
             cmd = [
-                ffmpeg_exe,
+                FFMPEG_PATH,
                 '-y',                          # Overwrite output
                 '-f', 'rawvideo',              # Input format
                 '-vcodec', 'rawvideo',         # Input codec
@@ -316,7 +369,7 @@ def create_mp4_writer(filepath: str, frame_size: Tuple[int, int], fps: int = 30)
     Returns:
         FFmpegWriter or cv2.VideoWriter instance
     """
-    if FFMPEG_AVAILABLE:
+    if FFMPEG_AVAILABLE and FFMPEG_PATH:
         writer = FFmpegWriter(filepath, frame_size, fps)
         if writer.isOpened():
             return writer
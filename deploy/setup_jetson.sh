@@ -39,7 +39,7 @@ echo "Generating TensorRT engine (this takes ~10-15 minutes)..."
 
 source api/venv/bin/activate
 
-yolo export model=models/yolov8n-pose.pt format=engine device=0 half=True workspace=4 verbose=False
+yolo export model=models/yolov8n-pose.pt format=engine device=0 half=True dynamic=True batch=8 workspace=4 verbose=False
 
 if [ -f "yolov8n-pose.engine" ]; then
     mv yolov8n-pose.engine models/
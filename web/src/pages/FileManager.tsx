@@ -28,7 +28,7 @@ interface VideoBatch {
   camera2_bag_name: string | null;
   camera1_type: 'realsense' | null;
   camera2_type: 'realsense' | null;
-  modified: string;
+  modified: number;            // Unix seconds
   patient_id?: string;
   recorded_at?: string;
   note?: string;
@@ -37,7 +37,7 @@ interface VideoBatch {
 interface FileInfo {
   name: string;
   size: number;
-  modified: string;
+  modified: number;            // Unix seconds
 }
 
 interface CameraQuality {
@@ -115,8 +115,8 @@ function formatSpeed(bytesPerSecond: number): string {
   return parseFloat((bytesPerSecond / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
 }
 
-function formatDate(isoString: string): string {
-  const date = new Date(isoString);
+function formatDate(epochSeconds: number): string {
+  const date = new Date(epochSeconds * 1000);
   return date.toLocaleString();
 }
 